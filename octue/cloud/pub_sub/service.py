@@ -1,9 +1,11 @@
+import atexit
 import base64
 import concurrent.futures
 import datetime
 import functools
 import json
 import logging
+import threading
 import time
 import uuid
 
@@ -30,6 +32,11 @@ ANSWERS_NAMESPACE = "answers"
 # microservices publishing single messages in a request-response sequence.
 BATCH_SETTINGS = pubsub_v1.types.BatchSettings(max_bytes=10 * 1000 * 1000, max_latency=0.01, max_messages=1)
 
+# By default, answer subscriptions are deleted in the background so waiting for an answer isn't held up by the deletion
+# request. The executor is shut down (waiting for any pending deletions) when the interpreter exits.
+CLEANUP_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="octue-cleanup")
+atexit.register(CLEANUP_EXECUTOR.shutdown, wait=True)
+
 
 class Service(CoolNameable):
     """A Twined service that can be used in two modes:
@@ -61,18 +68,21 @@ class Service(CoolNameable):
         self.run_function = run_function
         self._credentials = auth.default()[0]
         self.publisher = pubsub_v1.PublisherClient(credentials=self._credentials, batch_settings=BATCH_SETTINGS)
-        self._current_question = None
+        self._questions = {}
+        self._subscription_deletions = set()
+        self._subscription_deletions_lock = threading.Lock()
         super().__init__(*args, **kwargs)
 
     def __repr__(self):
         return f"<{type(self).__name__}({self.name!r})>"
 
-    def serve(self, timeout=None, delete_topic_and_subscription_on_exit=False):
+    def serve(self, timeout=None, delete_topic_and_subscription_on_exit=False, max_outstanding_questions=None):
         """Start the Service as a server, waiting to accept questions from any other Service using Google Pub/Sub on
         the same Google Cloud Platform project. Questions are responded to asynchronously.
 
         :param float|None timeout: time in seconds after which to shut down the service
         :param bool delete_topic_and_subscription_on_exit: if `True`, delete the service's topic and subscription on exit
+        :param int|None max_outstanding_questions: the maximum number of questions the subscriber leases from Pub/Sub at once; if `None`, the Pub/Sub client's default is used
         :return None:
         """
         logger.info("Starting service with ID %r.", self.id)
@@ -93,7 +103,16 @@ class Service(CoolNameable):
             topic.create(allow_existing=True)
             subscription.create(allow_existing=True)
 
-            future = subscriber.subscribe(subscription=subscription.path, callback=self.answer)
+            if max_outstanding_questions is None:
+                flow_control = pubsub_v1.types.FlowControl()
+            else:
+                flow_control = pubsub_v1.types.FlowControl(max_messages=max_outstanding_questions)
+
+            future = subscriber.subscribe(
+                subscription=subscription.path,
+                callback=self.answer,
+                flow_control=flow_control,
+            )
             logger.debug("%r is waiting for questions.", self)
 
             with subscriber:
@@ -253,8 +272,9 @@ class Service(CoolNameable):
             retry=retry.Retry(deadline=timeout),
         )
 
-        # Keep a record of the question asked in case it needs to be retried.
-        self._current_question = {
+        # Keep a record of the question asked in case it needs to be retried. Records are kept per answer subscription
+        # so answers to several outstanding questions can be waited for, including concurrently.
+        self._questions[response_subscription.name] = {
             "service_id": service_id,
             "input_values": input_values,
             "input_manifest": input_manifest,
@@ -275,9 +295,11 @@ class Service(CoolNameable):
         timeout=60,
         delivery_acknowledgement_timeout=30,
         retry_interval=5,
+        delete_subscription_in_background=True,
     ):
-        """Wait for an answer to a question on the given subscription, deleting the subscription and its topic once
-        the answer is received.
+        """Wait for an answer to a question on the given subscription, deleting the subscription once waiting has
+        finished. By default, the deletion is best-effort: it's submitted to a background thread and any error is logged
+        rather than raised. Use `wait_for_subscription_deletions` to wait for pending background deletions.
 
         :param octue.cloud.pub_sub.subscription.Subscription subscription: the subscription for the question's answer
         :param callable|None handle_monitor_message: a function to handle monitor messages (e.g. send them to an endpoint for plotting or displaying) - this function should take a single JSON-compatible python primitive as an argument (note that this could be an array or object)
@@ -285,6 +307,7 @@ class Service(CoolNameable):
         :param float|None timeout: how long in seconds to wait for an answer before raising a `TimeoutError`
         :param float delivery_acknowledgement_timeout: how long in seconds to wait for a delivery acknowledgement before resending the question
         :param float retry_interval: the time in seconds to wait between question retries
+        :param bool delete_subscription_in_background: if `False`, delete the subscription before returning, raising any error encountered
         :raise TimeoutError: if the timeout is exceeded
         :return dict: dictionary containing the keys "output_values" and "output_manifest"
         """
@@ -323,10 +346,52 @@ class Service(CoolNameable):
                         )
 
                         time.sleep(retry_interval)
-                        self.ask(**self._current_question)
+                        self.ask(**self._questions[subscription.name])
 
             finally:
-                subscription.delete()
+                self._questions.pop(subscription.name, None)
+
+                if delete_subscription_in_background:
+                    future = CLEANUP_EXECUTOR.submit(self._delete_subscription, subscription)
+
+                    with self._subscription_deletions_lock:
+                        self._subscription_deletions.add(future)
+
+                    future.add_done_callback(self._forget_subscription_deletion)
+                else:
+                    subscription.delete()
+
+    def wait_for_subscription_deletions(self, timeout=None):
+        """Wait for the answer subscriptions being deleted in the background to finish being deleted.
+
+        :param float|None timeout: how long in seconds to wait for the deletions; if `None`, wait indefinitely
+        :return bool: `True` if all the pending deletions finished within the timeout
+        """
+        with self._subscription_deletions_lock:
+            pending_deletions = tuple(self._subscription_deletions)
+
+        _, not_done = concurrent.futures.wait(pending_deletions, timeout=timeout)
+        return not not_done
+
+    def _delete_subscription(self, subscription):
+        """Delete the given subscription, logging rather than raising any error as this is run in the background.
+
+        :param octue.cloud.pub_sub.subscription.Subscription subscription:
+        :return None:
+        """
+        try:
+            subscription.delete()
+        except Exception:
+            logger.exception("%r failed to delete subscription %r.", self, subscription.name)
+
+    def _forget_subscription_deletion(self, future):
+        """Stop tracking the given finished background subscription deletion.
+
+        :param concurrent.futures.Future future:
+        :return None:
+        """
+        with self._subscription_deletions_lock:
+            self._subscription_deletions.discard(future)
 
     def _send_delivery_acknowledgment(self, topic, timeout=30):
         """Send an acknowledgement of question delivery to the asker.
@@ -342,7 +407,7 @@ class Service(CoolNameable):
             data=json.dumps(
                 {
                     "type": "delivery_acknowledgement",
-                    "delivery_time": str(datetime.datetime.now()),
+                    "delivery_time": datetime.datetime.now().isoformat(),
                     "message_number": topic.messages_published,
                 }
             ).encode(),
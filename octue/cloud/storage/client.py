@@ -94,8 +94,8 @@ class GoogleCloudStorageClient:
         with open(local_path, "rb") as f:
             blob.crc32c = self._compute_crc32c_checksum(f.read())
 
+        self._set_blob_custom_metadata(blob, metadata)
         blob.upload_from_filename(filename=local_path, timeout=timeout)
-        self._overwrite_blob_custom_metadata(blob, metadata)
         logger.debug("Uploaded %r to Google Cloud at %r.", local_path, blob.public_url)
 
     def upload_from_string(
@@ -115,8 +115,8 @@ class GoogleCloudStorageClient:
 
         blob = self._blob(cloud_path)
         blob.crc32c = self._compute_crc32c_checksum(string)
+        self._set_blob_custom_metadata(blob, metadata)
         blob.upload_from_string(data=string, timeout=timeout)
-        self._overwrite_blob_custom_metadata(blob, metadata)
         logger.debug("Uploaded data to Google Cloud at %r.", blob.public_url)
 
     def get_metadata(self, cloud_path=None, bucket_name=None, path_in_bucket=None, timeout=_DEFAULT_TIMEOUT):
@@ -300,6 +300,19 @@ class GoogleCloudStorageClient:
         checksum = Checksum(string_or_bytes)
         return base64.b64encode(checksum.digest()).decode("utf-8")
 
+    def _set_blob_custom_metadata(self, blob, metadata):
+        """Set the custom metadata for the given blob locally without syncing it with Google Cloud. This is used before
+        uploading so the metadata is sent in the same request as the data instead of a separate patch request.
+
+        :param google.cloud.storage.blob.Blob blob: Google Cloud Storage blob to set the metadata of
+        :param dict metadata: key-value pairs of metadata to set as the blob's metadata
+        :return None:
+        """
+        if not metadata:
+            return None
+
+        blob.metadata = self._encode_metadata(metadata)
+
     def _overwrite_blob_custom_metadata(self, blob, metadata):
         """Overwrite the custom metadata for the given blob. Note that this is synced up with Google Cloud.
 
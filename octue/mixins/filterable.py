@@ -1,4 +1,5 @@
 import collections.abc
+import functools
 import numbers
 
 from octue import exceptions
@@ -114,6 +115,54 @@ INTERFACE_FILTERS = {
 }
 
 
+@functools.lru_cache(maxsize=1024)
+def _split_filter_name(filter_name):
+    """Split the filter name into the attribute name and filter action, raising an error if it the attribute name
+    and filter action aren't delimited by a double underscore i.e. "__". Results are cached as the same few filter names
+    tend to be used repeatedly.
+
+    :param str filter_name:
+    :raise octue.exceptions.InvalidInputException: if the filter name doesn't include an attribute name
+    :return (str, str): the dot-separated (nested) attribute name and the filter action
+    """
+    *attribute_names, filter_action = filter_name.split("__")
+
+    if not attribute_names:
+
+        raise exceptions.InvalidInputException(
+            f"Invalid filter name {filter_name!r}. Filter names should be in the form "
+            f"'<attribute_name_0>__<attribute_name_1>__<...>__<filter_kind>' with at least one attribute name "
+            f"included."
+        )
+
+    return ".".join(attribute_names), filter_action
+
+
+@functools.lru_cache(maxsize=None)
+def _get_filter_actions_for_type(type_):
+    """Get the possible filters for attributes of the given type based on the type itself or its interface, raising an
+    error if the type isn't supported (i.e. if there aren't any filters defined for it). The result is cached per type
+    so the interface checks are only done once for each type filtered on.
+
+    :param type type_:
+    :raise octue.exceptions.InvalidInputException: if there are no filters for the type
+    :return dict(str, callable):
+    """
+    try:
+        return TYPE_FILTERS[type_.__name__]
+
+    except KeyError as error:
+        # This allows handling of objects that conform to a certain interface (e.g. iterables) without needing the
+        # specific type.
+        for interface, filter_actions in INTERFACE_FILTERS.items():
+            if issubclass(type_, interface):
+                return filter_actions
+
+        raise exceptions.InvalidInputException(
+            f"Attributes of type {error.args[0]} are not currently supported for filtering."
+        )
+
+
 class Filterable:
     def satisfies(self, raise_error_if_filter_is_invalid=True, **kwargs):
         """Check that the instance satisfies the given filter for the given filter value. The filter should be provided
@@ -132,7 +181,7 @@ class Filterable:
         filter_name, filter_value = list(kwargs.items())[0]
 
         try:
-            attribute_name, filter_action = self._split_filter_name(filter_name)
+            attribute_name, filter_action = _split_filter_name(filter_name)
 
             try:
                 attribute = get_nested_attribute(self, attribute_name)
@@ -149,53 +198,26 @@ class Filterable:
         except exceptions.InvalidInputException as error:
             return self._try_equals_filter_shortcut(filter_name, filter_value, error)
 
-    def _split_filter_name(self, filter_name):
-        """Split the filter name into the attribute name and filter action, raising an error if it the attribute name
-        and filter action aren't delimited by a double underscore i.e. "__".
-        """
-        *attribute_names, filter_action = filter_name.split("__")
-
-        if not attribute_names:
-
-            raise exceptions.InvalidInputException(
-                f"Invalid filter name {filter_name!r}. Filter names should be in the form "
-                f"'<attribute_name_0>__<attribute_name_1>__<...>__<filter_kind>' with at least one attribute name "
-                f"included."
-            )
-
-        return ".".join(attribute_names), filter_action
-
     def _get_filter(self, attribute, filter_action):
         """Get the filter for the attribute and filter action, raising an error if there is no filter action of that
         name.
         """
-        try:
-            return self._get_filter_actions_for_attribute(attribute)[filter_action]
+        filter_actions = self._get_filter_actions_for_attribute(attribute)
 
-        except KeyError as error:
-            raise exceptions.InvalidInputException(
-                f"There is no filter called {error.args[0]!r} for attributes of type {type(attribute)}. The options "
-                f"are {self._get_filter_actions_for_attribute(attribute).keys()!r}"
-            )
+        # Check membership rather than catching a `KeyError` so no exception is created and handled for invalid filters.
+        if filter_action in filter_actions:
+            return filter_actions[filter_action]
+
+        raise exceptions.InvalidInputException(
+            f"There is no filter called {filter_action!r} for attributes of type {type(attribute)}. The options are "
+            f"{filter_actions.keys()!r}"
+        )
 
     def _get_filter_actions_for_attribute(self, attribute):
         """Get the possible filters for the given attribute based on its type or interface, raising an error if the
         attribute's type isn't supported (i.e. if there aren't any filters defined for it).
         """
-        try:
-            return TYPE_FILTERS[type(attribute).__name__]
-
-        except KeyError as error:
-            # This allows handling of objects that conform to a certain interface (e.g. iterables) without needing the
-            # specific type.
-            for type_ in INTERFACE_FILTERS:
-                if not isinstance(attribute, type_):
-                    continue
-                return INTERFACE_FILTERS[type_]
-
-            raise exceptions.InvalidInputException(
-                f"Attributes of type {error.args[0]} are not currently supported for filtering."
-            )
+        return _get_filter_actions_for_type(type(attribute))
 
     def _try_equals_filter_shortcut(self, filter_name, filter_value, error):
         """Try to use the equals filter shortcut e.g. `a=7` instead of `a__equals=7` or `a__b=7` instead of
@@ -59,11 +59,7 @@ class Analysis(Identifiable, Serialisable, Labelable, Taggable):
     """
 
     def __init__(self, twine, handle_monitor_message=None, skip_checks=False, **kwargs):
-        if isinstance(twine, Twine):
-            self.twine = twine
-        else:
-            self.twine = Twine(source=twine)
-
+        self._twine = twine
         self._handle_monitor_message = handle_monitor_message
 
         strand_kwargs = {name: kwargs.pop(name, None) for name in ALL_STRANDS}
@@ -88,6 +84,18 @@ class Analysis(Identifiable, Serialisable, Labelable, Taggable):
 
         super().__init__(**kwargs)
 
+    @property
+    def twine(self):
+        """Get the analysis' twine. If the analysis was given the twine's JSON source rather than a `Twine` instance,
+        the source is only parsed the first time the twine is needed.
+
+        :return twined.Twine:
+        """
+        if not isinstance(self._twine, Twine):
+            self._twine = Twine(source=self._twine)
+
+        return self._twine
+
     def send_monitor_message(self, data):
         """Send a monitor message to the parent that requested the analysis.
 
@@ -1,3 +1,4 @@
+import base64
 import copy
 import datetime
 import functools
@@ -5,6 +6,7 @@ import json
 import logging
 import os
 import tempfile
+import time
 from urllib.parse import urlparse
 
 import google.api_core.exceptions
@@ -36,6 +38,10 @@ ID_DEFAULT = None
 TAGS_DEFAULT = None
 LABELS_DEFAULT = None
 
+# Files modified more recently than this don't have their hashes cached, as another write to them could happen within
+# the filesystem's timestamp resolution and leave their modification time unchanged.
+RECENTLY_MODIFIED_THRESHOLD_NS = 1_000_000_000
+
 
 class Datafile(Labelable, Taggable, Serialisable, Pathable, Identifiable, Hashable, Filterable):
     """A representation of a data file on the Octue system. If the given path is a cloud path and `hypothetical` is not
@@ -134,8 +140,11 @@ class Datafile(Labelable, Taggable, Serialisable, Pathable, Identifiable, Hashab
 
             if local_path:
                 # If there is no file at the given local path or the file is different to the one in the cloud, download
-                # the cloud file locally.
-                if not os.path.exists(local_path) or self._cloud_metadata.get("crc32c") != calculate_hash(local_path):
+                # the cloud file locally. The cloud checksum is base64-encoded so the local one is encoded to compare.
+                if not os.path.exists(local_path) or (
+                    self._cloud_metadata.get("crc32c")
+                    != base64.b64encode(calculate_hash(local_path).digest()).decode("utf-8")
+                ):
                     self.download(local_path)
                 else:
                     self._local_path = local_path
@@ -719,12 +728,50 @@ class _DatafileContextManager:
 
 
 def calculate_hash(path):
-    """Calculate the hash of the file at the given path."""
+    """Calculate the hash of the file at the given path. Hashes of files that haven't been modified recently are cached
+    against the file's inode, size, and modification and change times so unchanged files are only read once.
+
+    :param str path:
+    :return google_crc32c.Checksum:
+    """
+    stat = os.stat(path)
+
+    if time.time_ns() - stat.st_mtime_ns < RECENTLY_MODIFIED_THRESHOLD_NS:
+        return _calculate_file_hash(path)
+
+    # Return a copy so the cached checksum isn't affected if the caller continues to update it.
+    return _calculate_cached_hash(
+        os.path.abspath(path), stat.st_ino, stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns
+    ).copy()
+
+
+@functools.lru_cache(maxsize=4096)
+def _calculate_cached_hash(path, inode, size, modification_time, change_time):
+    """Calculate the hash of the file at the given path, caching it. The file's stat values are only used as part of
+    the cache key so the hash is recalculated if the file changes.
+
+    :param str path:
+    :param int inode:
+    :param int size:
+    :param int modification_time:
+    :param int change_time:
+    :return google_crc32c.Checksum:
+    """
+    return _calculate_file_hash(path)
+
+
+def _calculate_file_hash(path):
+    """Calculate the hash of the file at the given path.
+
+    :param str path:
+    :return google_crc32c.Checksum:
+    """
     hash = Checksum()
 
     with open(path, "rb") as f:
-        # Read and update hash value in blocks of 4K.
-        for byte_block in iter(lambda: f.read(4096), b""):
+        # Read and update hash value in blocks of 1MiB. The checksum itself runs in C, so larger blocks mean fewer
+        # Python-level reads and updates per file.
+        for byte_block in iter(lambda: f.read(1024 * 1024), b""):
             hash.update(byte_block)
 
     return hash
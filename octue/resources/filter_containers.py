@@ -46,19 +46,24 @@ class FilterContainer(ABC):
         :return FilterList:
         """
         attribute_name = ".".join(attribute_name.split("__"))
+        items = list(self)
 
         try:
-            results = FilterList(
-                sorted(self, key=lambda item: get_nested_attribute(item, attribute_name), reverse=reverse)
-            )
+            keys = [get_nested_attribute(item, attribute_name) for item in items]
 
         except AttributeError:
             raise exceptions.InvalidInputException(
                 f"An attribute named {attribute_name!r} does not exist on one or more members of {self!r}."
             )
 
+        # Sort the items' indices by their keys so each key is only looked up once and the sorted keys can be reused for
+        # the sequence checks below.
+        order = sorted(range(len(items)), key=keys.__getitem__, reverse=reverse)
+        results = FilterList(items[index] for index in order)
+        sorted_keys = [keys[index] for index in order]
+
         if check_start_value is not None:
-            if get_nested_attribute(results[0], attribute_name) != check_start_value:
+            if sorted_keys[0] != check_start_value:
                 raise exceptions.BrokenSequenceException(
                     f"The attribute {attribute_name!r} of the first item of {results!r} does equal the given start "
                     f"value {check_start_value!r}."
@@ -67,10 +72,8 @@ class FilterContainer(ABC):
         if check_constant_increment is not None:
             required_increment = check_constant_increment
 
-            for i in range(len(results) - 1):
-                actual_increment = get_nested_attribute(results[i + 1], attribute_name) - get_nested_attribute(
-                    results[i], attribute_name
-                )
+            for key, next_key in zip(sorted_keys, sorted_keys[1:]):
+                actual_increment = next_key - key
 
                 if actual_increment != required_increment:
                     raise exceptions.BrokenSequenceException(
@@ -1,12 +1,13 @@
 import json
-import re
+import string
 from collections import UserString
 
 from octue.exceptions import InvalidLabelException
-from octue.resources.filter_containers import FilterSet
 
 
-LABEL_PATTERN = re.compile(r"^[a-z0-9][a-z0-9-]*(?<!-)$")
+# Labels can contain these characters but can't start or end with a hyphen. Checking this with set operations is faster
+# than matching a regular expression.
+LABEL_CHARACTERS = frozenset(string.ascii_lowercase + string.digits + "-")
 
 
 class Label(UserString):
@@ -31,7 +32,12 @@ class Label(UserString):
 
         cleaned_name = name.strip()
 
-        if not re.match(LABEL_PATTERN, cleaned_name):
+        if not (
+            cleaned_name
+            and cleaned_name[0] != "-"
+            and cleaned_name[-1] != "-"
+            and LABEL_CHARACTERS.issuperset(cleaned_name)
+        ):
             raise InvalidLabelException(
                 f"Invalid label '{cleaned_name}'. Labels must contain only lowercase characters 'a-z', '0-9', and '-'. "
                 f"They must not start with '-'."
@@ -49,21 +55,22 @@ class LabelSet(set):
 
     def __init__(self, labels=None):
         # TODO Call the superclass with *args and **kwargs, then update everything to using ResourceBase
-        labels = labels or FilterSet()
+        labels = labels or ()
 
-        # JSON-encoded list of label names, or space-delimited string of label names.
+        # JSON-encoded list of label names, or space-delimited string of label names. Labels are passed straight to the
+        # set constructor rather than being collected into an intermediate set first.
         if isinstance(labels, str):
             try:
-                labels = FilterSet(Label(label) for label in json.loads(labels))
+                labels = map(Label, json.loads(labels))
             except json.decoder.JSONDecodeError:
-                labels = FilterSet(Label(label) for label in labels.strip().split())
+                labels = map(Label, labels.split())
 
         elif isinstance(labels, LabelSet):
-            labels = FilterSet(labels)
+            pass
 
         # Labels can be some other iterable than a list, but each label must be a Label or string.
         elif hasattr(labels, "__iter__"):
-            labels = FilterSet(label if isinstance(label, Label) else Label(label) for label in labels)
+            labels = (label if isinstance(label, Label) else Label(label) for label in labels)
 
         else:
             raise InvalidLabelException(
@@ -86,7 +93,8 @@ class LabelSet(set):
         :param str *labels: a variable number of string labels
         :return None:
         """
-        super().update({Label(label) for label in labels})
+        # Clean all the labels before adding any so an invalid label doesn't cause a partial update.
+        super().update(tuple(map(Label, labels)))
 
     def any_label_starts_with(self, value):
         """Return `True` if any of the labels starts with the value.
@@ -19,12 +19,13 @@ def get_backend(backend_name=None):
     if not backend_name:
         return GCPPubSubBackend
 
-    if backend_name not in AVAILABLE_BACKENDS:
+    try:
+        return AVAILABLE_BACKENDS[backend_name]
+
+    except KeyError:
         raise exceptions.BackendNotFound(
             f"Backend with name {backend_name} not found. Available backends are {list(AVAILABLE_BACKENDS.keys())}"
-        )
-
-    return AVAILABLE_BACKENDS[backend_name]
+        ) from None
 
 
 class ServiceBackend(ABC):
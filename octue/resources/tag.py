@@ -1,11 +1,13 @@
-import re
+import string
 from collections import UserDict
 
 from octue.exceptions import InvalidTagException
 from octue.mixins import Serialisable
 
 
-TAG_NAME_PATTERN = re.compile(r"^[a-z0-9][a-z0-9_]*(?<!_)$")
+# Tag names can contain these characters but can't start or end with an underscore. Checking this with set operations is
+# faster than matching a regular expression.
+TAG_NAME_CHARACTERS = frozenset(string.ascii_lowercase + string.digits + "_")
 
 
 class TagDict(Serialisable, UserDict):
@@ -26,8 +28,11 @@ class TagDict(Serialisable, UserDict):
         :param **kwargs: {str: any} pairs of tags as keyword arguments e.g. `my_tag=7`
         :return None:
         """
-        self._check_tag_format(*tags)
-        super().update(tags, **kwargs)
+        # Validate every tag name (including those given as keyword arguments) before adding any so an invalid name
+        # doesn't cause a partial update. The tags are then added in one go without being validated again by
+        # `__setitem__`.
+        self._check_tag_format(*tags, *kwargs)
+        self.data.update(tags, **kwargs)
 
     def _check_tag_format(self, *tags):
         """Check if each tag conforms to the tag name pattern.
@@ -36,7 +41,13 @@ class TagDict(Serialisable, UserDict):
         :return:
         """
         for tag in tags:
-            if not re.match(TAG_NAME_PATTERN, tag):
+            if not (
+                isinstance(tag, str)
+                and tag
+                and tag[0] != "_"
+                and tag[-1] != "_"
+                and TAG_NAME_CHARACTERS.issuperset(tag)
+            ):
                 raise InvalidTagException(
                     f"Invalid tag '{tag}'. Tags must contain only lowercase characters 'a-z', '0-9', and '_'. They "
                     f"must not start with '_'."
@@ -2,16 +2,21 @@ import os
 
 
 def isfolder(*args, make_if_absent=False):
-    """Return `True` if input path is the name of a valid, existing, file. Joins multiple inputs.
+    """Return `True` if input path is the name of a valid, existing, folder. Joins multiple inputs.
 
     tf = isfolder(str) Returns true is str is a full (or relative from the current working directory) folder path,
     false otherwise.
 
     tf = isfolder(str1, str2, ...) Concatenates any number of strings using the platform-specific file separator before
     testing for presence of the folder. Equivalent to typing octue.utils.isfolder(os.path.join(str1, str2, ...))
+
+    If `make_if_absent` is `True`, the folder is created if it doesn't already exist.
     """
     path = os.path.join(*args)
+
     if make_if_absent:
+        # `os.makedirs` raises an error if the path exists but isn't a folder, so there's no need to check it again.
         os.makedirs(path, exist_ok=True)
+        return True
 
     return os.path.isdir(path)
@@ -1,9 +1,11 @@
+import functools
 import os
 import unittest
 
 import yaml
 
 from octue.cloud.emulators import GoogleCloudStorageEmulatorTestResultModifier
+from octue.cloud.storage import GoogleCloudStorageClient
 from octue.mixins import MixinBase, Pathable
 from octue.resources import Datafile, Dataset, Manifest
 from tests import TEST_BUCKET_NAME
@@ -13,6 +15,16 @@ class MyPathable(Pathable, MixinBase):
     pass
 
 
+@functools.lru_cache(maxsize=None)
+def get_storage_client():
+    """Get a storage client for the tests to use. The client is created on first use (after the storage emulator has
+    started) and then shared so the default credentials are only resolved once.
+
+    :return octue.cloud.storage.client.GoogleCloudStorageClient:
+    """
+    return GoogleCloudStorageClient()
+
+
 class BaseTestCase(unittest.TestCase):
     """Base test case for twined:
     - sets a path to the test data directory
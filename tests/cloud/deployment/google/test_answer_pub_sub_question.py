@@ -15,6 +15,22 @@ SERVICE_ID = "octue.services.14b124f3-8ca9-4baf-99f5-0b79179f04a6"
 
 
 class TestAnswerPubSubQuestion(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Replace the `Topic` class used by `Service` and the `Service` class used by `answer_question` with mocks for
+        all the tests in the class.
+
+        :return None:
+        """
+        super().setUpClass()
+
+        for patch in (
+            mock.patch("octue.cloud.pub_sub.service.Topic", new=MockTopic),
+            mock.patch("octue.cloud.deployment.google.answer_pub_sub_question.Service"),
+        ):
+            patch.start()
+            cls.addClassCleanup(patch.stop)
+
     def test_error_raised_when_no_service_id_environment_variable(self):
         """Test that a MissingServiceID error is raised if the SERVICE_ID environment variable is missing."""
         with self.assertRaises(MissingServiceID):
@@ -48,15 +64,13 @@ class TestAnswerPubSubQuestion(TestCase):
                 unittest.mock.mock_open(read_data=yaml.dump({"services": [{"name": "test-service"}]})),
             ):
                 with mock.patch("octue.cloud.deployment.google.answer_pub_sub_question.Runner") as mock_runner:
-                    with mock.patch("octue.cloud.pub_sub.service.Topic", new=MockTopic):
-                        with mock.patch("octue.cloud.deployment.google.answer_pub_sub_question.Service"):
-                            answer_question(
-                                question={
-                                    "data": {},
-                                    "attributes": {"question_uuid": "8c859f87-b594-4297-883f-cd1c7718ef29"},
-                                },
-                                project_name="a-project-name",
-                            )
+                    answer_question(
+                        question={
+                            "data": {},
+                            "attributes": {"question_uuid": "8c859f87-b594-4297-883f-cd1c7718ef29"},
+                        },
+                        project_name="a-project-name",
+                    )
 
         mock_runner.assert_called_with(
             **{
@@ -95,15 +109,13 @@ class TestAnswerPubSubQuestion(TestCase):
         with mock.patch.dict(os.environ, {"SERVICE_ID": SERVICE_ID}):
             with mock.patch("octue.configuration.open", unittest.mock.mock_open(mock=MockOpenForConfigurationFiles)):
                 with mock.patch("octue.cloud.deployment.google.answer_pub_sub_question.Runner") as mock_runner:
-                    with mock.patch("octue.cloud.pub_sub.service.Topic", new=MockTopic):
-                        with mock.patch("octue.cloud.deployment.google.answer_pub_sub_question.Service"):
-                            answer_question(
-                                question={
-                                    "data": {},
-                                    "attributes": {"question_uuid": "8c859f87-b594-4297-883f-cd1c7718ef29"},
-                                },
-                                project_name="a-project-name",
-                            )
+                    answer_question(
+                        question={
+                            "data": {},
+                            "attributes": {"question_uuid": "8c859f87-b594-4297-883f-cd1c7718ef29"},
+                        },
+                        project_name="a-project-name",
+                    )
 
         mock_runner.assert_called_with(
             **{
@@ -1,5 +1,6 @@
 import json
 import logging
+import queue
 
 import google.api_core.exceptions
 
@@ -10,6 +11,9 @@ from octue.resources import Manifest
 
 MESSAGES = {}
 
+# How long a mock pull waits for a message to arrive if no timeout is given (the real subscriber blocks server-side).
+DEFAULT_PULL_TIMEOUT = 0.01
+
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +29,7 @@ def get_service_id(path):
 
 
 class MockTopic(Topic):
-    """A mock topic that registers in a global messages dictionary rather than Google Pub/Sub."""
+    """A mock topic that registers a message queue in a global messages dictionary rather than Google Pub/Sub."""
 
     def create(self, allow_existing=False):
         """Register the topic in the global messages dictionary.
@@ -39,7 +43,7 @@ class MockTopic(Topic):
                 raise google.api_core.exceptions.AlreadyExists(f"Topic {self.path!r} already exists.")
 
         if not self.exists():
-            MESSAGES[get_service_id(self.path)] = []
+            MESSAGES[get_service_id(self.path)] = queue.Queue()
 
     def delete(self):
         """Delete the topic from the global messages dictionary.
@@ -99,7 +103,15 @@ class MockFuture:
 
 
 class MockPublisher:
-    """A mock publisher that puts messages in a global dictionary instead of Google Pub/Sub."""
+    """A mock publisher that puts messages in a global dictionary instead of Google Pub/Sub.
+
+    :param google.auth.credentials.Credentials|None credentials:
+    :param google.cloud.pubsub_v1.types.BatchSettings|None batch_settings:
+    :return None:
+    """
+
+    def __init__(self, credentials=None, batch_settings=None):
+        pass
 
     def publish(self, topic, data, retry=None, **attributes):
         """Put the data and attributes into a MockMessage and add it to the global messages dictionary before returning
@@ -110,7 +122,7 @@ class MockPublisher:
         :param google.api_core.retry.Retry|None retry:
         :return MockFuture:
         """
-        MESSAGES[get_service_id(topic)].append(MockMessage(data=data, **attributes))
+        MESSAGES[get_service_id(topic)].put(MockMessage(data=data, **attributes))
         return MockFuture()
 
 
@@ -126,11 +138,12 @@ class MockSubscriber:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.closed = True
 
-    def subscribe(self, subscription, callback):
+    def subscribe(self, subscription, callback, flow_control=None):
         """Simulate subscribing to a topic by returning a mock future.
 
         :param MockSubscription subscription:
         :param callable callback:
+        :param google.cloud.pubsub_v1.types.FlowControl|None flow_control:
         :return MockFuture:
         """
         if self.closed:
@@ -141,23 +154,27 @@ class MockSubscriber:
     def pull(self, request, timeout=None, retry=None):
         """Return a MockPullResponse containing one MockMessage wrapped in a MockMessageWrapper. The MockMessage is
         retrieved from the global messages dictionary for the subscription included in the request under the
-        "subscription" key.
+        "subscription" key. If no message is available, block until one arrives or the timeout is reached, in which
+        case an empty MockPullResponse is returned.
 
         :param dict request:
-        :param float|None timeout:
+        :param float|None timeout: how long to wait for a message in seconds (defaults to `DEFAULT_PULL_TIMEOUT`)
         :param google.api_core.retry.Retry|None retry:
         :return MockPullResponse:
         """
         if self.closed:
             raise ValueError("ValueError: Cannot invoke RPC: Channel closed!")
 
+        if timeout is None:
+            timeout = DEFAULT_PULL_TIMEOUT
+
         try:
-            return MockPullResponse(
-                received_messages=[MockMessageWrapper(message=MESSAGES[get_service_id(request["subscription"])].pop(0))]
-            )
-        except IndexError:
+            message = MESSAGES[get_service_id(request["subscription"])].get(timeout=timeout)
+        except queue.Empty:
             return MockPullResponse(received_messages=[])
 
+        return MockPullResponse(received_messages=[MockMessageWrapper(message=message)])
+
     def acknowledge(self, request):
         """Do nothing.
 
@@ -25,7 +25,10 @@ class TestGooglePubSubHandler(BaseTestCase):
         log_record = makeLogRecord({"msg": "Starting analysis."})
         GooglePubSubHandler(service.publisher, topic, "analysis-id").emit(log_record)
 
-        self.assertEqual(json.loads(MESSAGES[topic.name][0].data.decode())["log_record"]["msg"], "Starting analysis.")
+        self.assertEqual(
+            json.loads(MESSAGES[topic.name].get_nowait().data.decode())["log_record"]["msg"],
+            "Starting analysis.",
+        )
 
     def test_emit_with_non_json_serialisable_args(self):
         """Test that non-JSON-serialisable arguments to log messages are converted to their string representation
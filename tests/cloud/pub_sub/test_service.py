@@ -1,6 +1,8 @@
+import concurrent.futures
+import functools
 import logging
+import os
 import tempfile
-import uuid
 from unittest.mock import patch
 
 import twined.exceptions
@@ -15,12 +17,14 @@ from tests.cloud.pub_sub.mocks import (
     DifferentMockAnalysis,
     MockAnalysis,
     MockAnalysisWithOutputManifest,
+    MockPublisher,
     MockPullResponse,
     MockService,
     MockSubscriber,
     MockSubscription,
     MockTopic,
 )
+from twined import Twine
 
 
 logger = logging.getLogger(__name__)
@@ -28,9 +32,54 @@ logger = logging.getLogger(__name__)
 
 BACKEND = GCPPubSubBackend(project_name=TEST_PROJECT_NAME)
 
+# A service ID for tests that fail before the service would be contacted.
+PLACEHOLDER_SERVICE_ID = "00000000-0000-0000-0000-000000000000"
 
+# Mock analyses aren't mutated by the services returning them, so a single instance can be shared between tests.
+MOCK_ANALYSIS = MockAnalysis()
+
+# The answer expected from a child whose run function returns `MOCK_ANALYSIS`.
+EXPECTED_MOCK_ANALYSIS_ANSWER = {
+    "output_values": MOCK_ANALYSIS.output_values,
+    "output_manifest": MOCK_ANALYSIS.output_manifest,
+}
+
+INPUT_VALUES_TWINE = """
+    {
+        "input_values_schema": {
+            "type": "object",
+            "required": []
+        }
+    }
+"""
+
+MONITOR_MESSAGE_TWINE = """
+    {
+        "input_values_schema": {"type": "object", "required": []},
+        "monitor_message_schema": {
+            "type": "object",
+            "properties": {"status": {"type": "string"}},
+            "required": ["status"]
+        }
+    }
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def load_twine(source):
+    """Load a twine from the given JSON string. Each distinct twine is only parsed once and is then shared between
+    tests.
+
+    :param str source:
+    :return twined.Twine:
+    """
+    return Twine(source=source)
+
+
+@functools.lru_cache(maxsize=None)
 def create_run_function():
-    """Create a run function that sends log messages back to the parent and gives a simple output value.
+    """Create a run function that sends log messages back to the parent and gives a simple output value. The underlying
+    `Runner` is only created once and shared between tests as its app and twine never change.
 
     :return callable: the run function
     """
@@ -41,16 +90,34 @@ def create_run_function():
         analysis.output_manifest = None
         logger.info("Finished analysis.")
 
-    twine = """
-        {
-            "input_values_schema": {
-                "type": "object",
-                "required": []
-            }
-        }
+    return Runner(app_src=mock_app, twine=load_twine(INPUT_VALUES_TWINE)).run
+
+
+@functools.lru_cache(maxsize=None)
+def create_exception_logging_run_function():
+    """Create a run function that logs an exception. The underlying `Runner` is only created once and shared between
+    tests.
+
+    :return callable: the run function
     """
 
-    return Runner(app_src=mock_app, twine=twine).run
+    def mock_app(analysis):
+        try:
+            raise OSError("This is an OSError.")
+        except OSError:
+            logger.exception("An example exception to log and forward to the parent.")
+
+    return Runner(app_src=mock_app, twine=load_twine(INPUT_VALUES_TWINE)).run
+
+
+def return_constant(constant, analysis_id, input_values, input_manifest, analysis_log_handler, handle_monitor_message):
+    """A run function that ignores its inputs and returns the given constant. Partially apply the constant to use it as
+    a service's run function.
+
+    :param any constant:
+    :return any:
+    """
+    return constant
 
 
 class TestService(BaseTestCase):
@@ -58,24 +125,62 @@ class TestService(BaseTestCase):
     (GCP), or a local emulator.
     """
 
+    @classmethod
+    def setUpClass(cls):
+        """Replace the `Topic` and `Subscription` classes used by `Service` and the Google Pub/Sub publisher and
+        subscriber clients with their mocks for all the tests in the class, and create a cloud-based input manifest and
+        a served child for them to share.
+
+        :return None:
+        """
+        super().setUpClass()
+
+        # Each patch's cleanup is registered as soon as it's started so it's still stopped if a later part of this
+        # method fails.
+        for patch_ in (
+            patch.multiple("octue.cloud.pub_sub.service", Topic=MockTopic, Subscription=MockSubscription),
+            patch("google.cloud.pubsub_v1.SubscriberClient", new=MockSubscriber),
+            patch("google.cloud.pubsub_v1.PublisherClient", new=MockPublisher),
+        ):
+            patch_.start()
+            cls.addClassCleanup(patch_.stop)
+
+        # This manifest isn't mutated by the tests so it can be shared between them.
+        cls.cloud_input_manifest = Manifest(
+            datasets={
+                "my-dataset": Dataset(
+                    files=[
+                        Datafile(path="gs://my-dataset/hello.txt", project_name=TEST_PROJECT_NAME, hypothetical=True),
+                        Datafile(path="gs://my-dataset/goodbye.csv", project_name=TEST_PROJECT_NAME, hypothetical=True),
+                    ]
+                )
+            },
+            path="gs://my-dataset",
+        )
+
+        # Tests that only need a child returning the default mock analysis can share this one.
+        cls.served_child = cls.make_new_child(BACKEND, run_function_returnee=MOCK_ANALYSIS)
+        cls._served_child_run_function = cls.served_child.run_function
+        cls.served_child.serve()
+
+    def setUp(self):
+        """Reset the shared served child's run function in case a previous test replaced it.
+
+        :return None:
+        """
+        super().setUp()
+        self.served_child.run_function = self._served_child_run_function
+
     @staticmethod
-    def make_new_child(backend, run_function_returnee, use_mock=False):
-        """Make and return a new child service that returns the given run function returnee when its run function is
-        executed.
+    def make_new_child(backend, run_function_returnee):
+        """Make and return a new mock child service that returns the given run function returnee when its run function
+        is executed.
 
         :param octue.resources.service_backends.ServiceBackend backend:
         :param any run_function_returnee:
-        :param bool use_mock:
         :return tests.cloud.pub_sub.mocks.MockService:
         """
-        run_function = (
-            lambda analysis_id, input_values, input_manifest, analysis_log_handler, handle_monitor_message: run_function_returnee
-        )
-
-        if use_mock:
-            return MockService(backend=backend, run_function=run_function)
-
-        return Service(backend=backend, run_function=run_function)
+        return MockService(backend=backend, run_function=functools.partial(return_constant, run_function_returnee))
 
     @staticmethod
     def ask_question_and_wait_for_answer(
@@ -123,7 +228,7 @@ class TestService(BaseTestCase):
         :param Exception exception_to_raise:
         :return tests.cloud.pub_sub.mocks.MockService:
         """
-        child = self.make_new_child(BACKEND, run_function_returnee=None, use_mock=True)
+        child = self.make_new_child(BACKEND, run_function_returnee=None)
 
         def error_run_function(analysis_id, input_values, input_manifest, analysis_log_handler, handle_monitor_message):
             raise exception_to_raise
@@ -148,22 +253,17 @@ class TestService(BaseTestCase):
 
     def test_service_id_cannot_be_non_none_empty_value(self):
         """Ensure that a ValueError is raised if a non-None empty value is provided as the service_id."""
-        with self.assertRaises(ValueError):
-            Service(backend=BACKEND, service_id="")
-
-        with self.assertRaises(ValueError):
-            Service(backend=BACKEND, service_id=[])
-
-        with self.assertRaises(ValueError):
-            Service(backend=BACKEND, service_id={})
+        for service_id in ("", [], {}):
+            with self.subTest(service_id=service_id):
+                with self.assertRaises(ValueError):
+                    Service(backend=BACKEND, service_id=service_id)
 
     def test_ask_on_non_existent_service_results_in_error(self):
         """Test that trying to ask a question to a non-existent service (i.e. one without a topic in Google Pub/Sub)
         results in an error.
         """
-        with patch("octue.cloud.pub_sub.service.Topic", new=MockTopic):
-            with self.assertRaises(exceptions.ServiceNotFound):
-                MockService(backend=BACKEND).ask(service_id="hello", input_values=[1, 2, 3, 4])
+        with self.assertRaises(exceptions.ServiceNotFound):
+            MockService(backend=BACKEND).ask(service_id="hello", input_values=[1, 2, 3, 4])
 
     def test_timeout_error_raised_if_no_messages_received_when_waiting(self):
         """Test that a TimeoutError is raised if no messages are received while waiting."""
@@ -198,6 +298,85 @@ class TestService(BaseTestCase):
         with self.assertRaises(exceptions.PushSubscriptionCannotBePulled):
             service.wait_for_answer(subscription=mock_subscription)
 
+    def test_answer_subscription_is_deleted_in_background_by_default(self):
+        """Test that the answer subscription is deleted in the background once an answer has been received."""
+        child = self.served_child
+        parent = MockService(backend=BACKEND, children={child.id: child})
+
+        with patch("tests.cloud.pub_sub.mocks.MockSubscription.delete") as mock_delete:
+            answer = self.ask_question_and_wait_for_answer(
+                parent=parent,
+                child=child,
+                input_values={},
+                input_manifest=None,
+            )
+
+            self.assertTrue(parent.wait_for_subscription_deletions(timeout=5))
+
+        self.assertEqual(answer, EXPECTED_MOCK_ANALYSIS_ANSWER)
+        mock_delete.assert_called_once()
+
+    def test_errors_deleting_answer_subscription_in_background_are_logged(self):
+        """Test that errors raised while deleting the answer subscription in the background are logged instead of being
+        raised.
+        """
+        child = self.served_child
+        parent = MockService(backend=BACKEND, children={child.id: child})
+
+        with patch("tests.cloud.pub_sub.mocks.MockSubscription.delete", side_effect=ValueError("Deletion failed.")):
+            with self.assertLogs("octue.cloud.pub_sub.service", level=logging.ERROR) as logging_context:
+                answer = self.ask_question_and_wait_for_answer(
+                    parent=parent,
+                    child=child,
+                    input_values={},
+                    input_manifest=None,
+                )
+
+                self.assertTrue(parent.wait_for_subscription_deletions(timeout=5))
+
+        self.assertEqual(answer, EXPECTED_MOCK_ANALYSIS_ANSWER)
+        self.assertIn("failed to delete subscription", logging_context.output[0])
+
+    def test_answer_subscription_can_be_deleted_synchronously(self):
+        """Test that the answer subscription is deleted before `wait_for_answer` returns if background deletion is
+        switched off.
+        """
+        child = self.served_child
+        parent = MockService(backend=BACKEND, children={child.id: child})
+        subscription, _ = parent.ask(service_id=child.id, input_values={})
+
+        with patch("tests.cloud.pub_sub.mocks.MockSubscription.delete") as mock_delete:
+            answer = parent.wait_for_answer(subscription, delete_subscription_in_background=False)
+            mock_delete.assert_called_once()
+
+        self.assertEqual(answer, EXPECTED_MOCK_ANALYSIS_ANSWER)
+        self.assertTrue(parent.wait_for_subscription_deletions(timeout=0))
+
+    def test_background_deletions_of_all_outstanding_answer_subscriptions_can_be_waited_for(self):
+        """Test that the background deletions of the answer subscriptions of several questions can all be waited for."""
+        child = self.served_child
+        parent = MockService(backend=BACKEND, children={child.id: child})
+        subscriptions = [parent.ask(service_id=child.id, input_values={})[0] for _ in range(3)]
+
+        with patch("tests.cloud.pub_sub.mocks.MockSubscription.delete") as mock_delete:
+            for subscription in subscriptions:
+                parent.wait_for_answer(subscription)
+
+            self.assertTrue(parent.wait_for_subscription_deletions(timeout=5))
+
+        self.assertEqual(mock_delete.call_count, 3)
+
+    def test_serve_passes_maximum_outstanding_questions_to_subscriber_flow_control(self):
+        """Test that the maximum number of outstanding questions given to `Service.serve` is used as the maximum number
+        of messages in the subscriber's flow control settings.
+        """
+        service = MockService(backend=BACKEND)
+
+        with patch("tests.cloud.pub_sub.mocks.MockSubscriber.subscribe") as mock_subscribe:
+            service.serve(max_outstanding_questions=3)
+
+        self.assertEqual(mock_subscribe.call_args.kwargs["flow_control"].max_messages, 3)
+
     def test_exceptions_in_responder_are_handled_and_sent_to_asker(self):
         """Test that exceptions raised in the child service are handled and sent back to the asker."""
         child = self.make_child_service_with_error(
@@ -206,18 +385,15 @@ class TestService(BaseTestCase):
 
         parent = MockService(backend=BACKEND, children={child.id: child})
 
-        with patch("octue.cloud.pub_sub.service.Topic", new=MockTopic):
-            with patch("octue.cloud.pub_sub.service.Subscription", new=MockSubscription):
-                with patch("google.cloud.pubsub_v1.SubscriberClient", new=MockSubscriber):
-                    child.serve()
+        child.serve()
 
-                    with self.assertRaises(twined.exceptions.InvalidManifestContents) as context:
-                        self.ask_question_and_wait_for_answer(
-                            parent=parent,
-                            child=child,
-                            input_values={},
-                            input_manifest=None,
-                        )
+        with self.assertRaises(twined.exceptions.InvalidManifestContents) as context:
+            self.ask_question_and_wait_for_answer(
+                parent=parent,
+                child=child,
+                input_values={},
+                input_manifest=None,
+            )
 
         self.assertIn("'met_mast_id' is a required property", context.exception.args[0])
 
@@ -228,18 +404,15 @@ class TestService(BaseTestCase):
         child = self.make_child_service_with_error(FileNotFoundError(2, "No such file or directory: 'blah'"))
         parent = MockService(backend=BACKEND, children={child.id: child})
 
-        with patch("octue.cloud.pub_sub.service.Topic", new=MockTopic):
-            with patch("octue.cloud.pub_sub.service.Subscription", new=MockSubscription):
-                with patch("google.cloud.pubsub_v1.SubscriberClient", new=MockSubscriber):
-                    child.serve()
+        child.serve()
 
-                    with self.assertRaises(FileNotFoundError) as context:
-                        self.ask_question_and_wait_for_answer(
-                            parent=parent,
-                            child=child,
-                            input_values={},
-                            input_manifest=None,
-                        )
+        with self.assertRaises(FileNotFoundError) as context:
+            self.ask_question_and_wait_for_answer(
+                parent=parent,
+                child=child,
+                input_values={},
+                input_manifest=None,
+            )
 
         self.assertIn("[Errno 2] No such file or directory: 'blah'", format(context.exception))
 
@@ -252,18 +425,15 @@ class TestService(BaseTestCase):
         child = self.make_child_service_with_error(AnUnknownException("This is an exception unknown to the asker."))
         parent = MockService(backend=BACKEND, children={child.id: child})
 
-        with patch("octue.cloud.pub_sub.service.Topic", new=MockTopic):
-            with patch("octue.cloud.pub_sub.service.Subscription", new=MockSubscription):
-                with patch("google.cloud.pubsub_v1.SubscriberClient", new=MockSubscriber):
-                    child.serve()
+        child.serve()
 
-                    with self.assertRaises(Exception) as context:
-                        self.ask_question_and_wait_for_answer(
-                            parent=parent,
-                            child=child,
-                            input_values={},
-                            input_manifest=None,
-                        )
+        with self.assertRaises(Exception) as context:
+            self.ask_question_and_wait_for_answer(
+                parent=parent,
+                child=child,
+                input_values={},
+                input_manifest=None,
+            )
 
         self.assertEqual(type(context.exception).__name__, "AnUnknownException")
         self.assertIn("This is an exception unknown to the asker.", context.exception.args[0])
@@ -272,34 +442,56 @@ class TestService(BaseTestCase):
         """Test that a question is asked again if delivery is not acknowledged and that the re-asked question is then
         processed.
         """
-        child = self.make_new_child(backend=BACKEND, run_function_returnee=MockAnalysis(), use_mock=True)
+        child = self.make_new_child(backend=BACKEND, run_function_returnee=MOCK_ANALYSIS)
         parent = MockService(backend=BACKEND, children={child.id: child})
 
-        with patch("octue.cloud.pub_sub.service.Topic", new=MockTopic):
-            with patch("octue.cloud.pub_sub.service.Subscription", new=MockSubscription):
-                with patch("google.cloud.pubsub_v1.SubscriberClient", new=MockSubscriber):
-                    child.serve()
+        child.serve()
 
-                    # Stop the child service from answering.
-                    with patch("octue.cloud.pub_sub.service.Service.answer"):
-                        subscription, _ = parent.ask(service_id=child.id, input_values={})
+        # Stop the child service from answering.
+        with patch("octue.cloud.pub_sub.service.Service.answer"):
+            subscription, _ = parent.ask(service_id=child.id, input_values={})
 
-                    # Wait for an answer and check that the question is asked again.
-                    with self.assertLogs() as logging_context:
-                        answer = parent.wait_for_answer(
-                            subscription,
-                            delivery_acknowledgement_timeout=0.01,
-                            retry_interval=0.1,
-                        )
+        # Wait for an answer and check that the question is asked again.
+        with self.assertLogs() as logging_context:
+            answer = parent.wait_for_answer(
+                subscription,
+                delivery_acknowledgement_timeout=0.01,
+                retry_interval=0,
+            )
 
-                        self.assertTrue(
-                            any(
-                                "No acknowledgement of question delivery" in log_message
-                                for log_message in logging_context.output
-                            )
-                        )
+            self.assertTrue(
+                any("No acknowledgement of question delivery" in log_message for log_message in logging_context.output)
+            )
+
+        self.assertEqual(answer, EXPECTED_MOCK_ANALYSIS_ANSWER)
+
+    def test_retried_question_is_the_one_being_waited_for_when_several_are_outstanding(self):
+        """Test that, if delivery of one of several outstanding questions isn't acknowledged, the question asked again is
+        the one being waited for rather than the most recently asked one.
+        """
+
+        def echo_run_function(analysis_id, input_values, input_manifest, analysis_log_handler, handle_monitor_message):
+            return MockAnalysis(output_values=input_values)
+
+        child = MockService(backend=BACKEND, run_function=echo_run_function)
+        parent = MockService(backend=BACKEND, children={child.id: child})
+
+        child.serve()
+
+        # Stop the child service from answering either question the first time they're asked.
+        with patch("octue.cloud.pub_sub.service.Service.answer"):
+            subscriptions = [parent.ask(service_id=child.id, input_values={"question": i})[0] for i in range(2)]
 
-        self.assertEqual(answer, {"output_values": "Hello! It worked!", "output_manifest": None})
+        for i, subscription in enumerate(subscriptions):
+            with self.subTest(question=i):
+                answer = parent.wait_for_answer(
+                    subscription,
+                    timeout=5,
+                    delivery_acknowledgement_timeout=0.01,
+                    retry_interval=0,
+                )
+
+                self.assertEqual(answer["output_values"], {"question": i})
 
     def test_ask_with_real_run_function_with_no_log_message_forwarding(self):
         """Test that a service can ask a question to another service that is serving and receive an answer. Use a real
@@ -310,23 +502,17 @@ class TestService(BaseTestCase):
         parent = MockService(backend=BACKEND, children={child.id: child})
 
         with self.assertLogs() as logging_context:
-            with patch("octue.cloud.pub_sub.service.Topic", new=MockTopic):
-                with patch("octue.cloud.pub_sub.service.Subscription", new=MockSubscription):
-                    with patch("google.cloud.pubsub_v1.SubscriberClient", new=MockSubscriber):
-                        child.serve()
-
-                        answer = self.ask_question_and_wait_for_answer(
-                            parent=parent,
-                            child=child,
-                            input_values={},
-                            input_manifest=None,
-                            subscribe_to_logs=False,
-                        )
+            child.serve()
 
-        self.assertEqual(
-            answer,
-            {"output_values": MockAnalysis().output_values, "output_manifest": MockAnalysis().output_manifest},
-        )
+            answer = self.ask_question_and_wait_for_answer(
+                parent=parent,
+                child=child,
+                input_values={},
+                input_manifest=None,
+                subscribe_to_logs=False,
+            )
+
+        self.assertEqual(answer, EXPECTED_MOCK_ANALYSIS_ANSWER)
 
         self.assertTrue(all("[REMOTE]" not in message for message in logging_context.output))
 
@@ -339,87 +525,62 @@ class TestService(BaseTestCase):
         parent = MockService(backend=BACKEND, children={child.id: child})
 
         with self.assertLogs() as logs_context_manager:
-            with patch("octue.cloud.pub_sub.service.Topic", new=MockTopic):
-                with patch("octue.cloud.pub_sub.service.Subscription", new=MockSubscription):
-                    with patch("google.cloud.pubsub_v1.SubscriberClient", new=MockSubscriber):
-                        child.serve()
-
-                        answer = self.ask_question_and_wait_for_answer(
-                            parent=parent,
-                            child=child,
-                            input_values={},
-                            input_manifest=None,
-                            subscribe_to_logs=True,
-                            service_name="my-super-service",
-                        )
+            child.serve()
 
-        self.assertEqual(
-            answer,
-            {"output_values": MockAnalysis().output_values, "output_manifest": MockAnalysis().output_manifest},
-        )
+            answer = self.ask_question_and_wait_for_answer(
+                parent=parent,
+                child=child,
+                input_values={},
+                input_manifest=None,
+                subscribe_to_logs=True,
+                service_name="my-super-service",
+            )
+
+        self.assertEqual(answer, EXPECTED_MOCK_ANALYSIS_ANSWER)
 
         # Check that the two expected remote log messages were logged consecutively in the right order with the service
         # name added as context at the start of the messages.
-        start_remote_analysis_message_present = False
-        finish_remote_analysis_message_present = False
-
-        for i, log_record in enumerate(logs_context_manager.records):
-            if "[my-super-service" in log_record.msg and "] Starting analysis." in log_record.msg:
-                start_remote_analysis_message_present = True
-
-                if (
-                    "[my-super-service" in logs_context_manager.records[i + 1].msg
-                    and "] Finished analysis." in logs_context_manager.records[i + 1].msg
-                ):
-                    finish_remote_analysis_message_present = True
-
-                break
+        messages = [log_record.msg for log_record in logs_context_manager.records]
+
+        start_message_index = next(
+            (
+                i
+                for i, message in enumerate(messages)
+                if "[my-super-service" in message and "] Starting analysis." in message
+            ),
+            None,
+        )
 
-        self.assertTrue(start_remote_analysis_message_present)
-        self.assertTrue(finish_remote_analysis_message_present)
+        self.assertIsNotNone(start_message_index)
+        self.assertIn("[my-super-service", messages[start_message_index + 1])
+        self.assertIn("] Finished analysis.", messages[start_message_index + 1])
 
     def test_ask_with_forwarding_exception_log_message(self):
         """Test that exception/error logs are forwarded to the asker successfully."""
 
-        def create_exception_logging_run_function():
-            def mock_app(analysis):
-                try:
-                    raise OSError("This is an OSError.")
-                except OSError:
-                    logger.exception("An example exception to log and forward to the parent.")
-
-            return Runner(app_src=mock_app, twine='{"input_values_schema": {"type": "object", "required": []}}').run
-
         child = MockService(backend=BACKEND, run_function=create_exception_logging_run_function())
         parent = MockService(backend=BACKEND, children={child.id: child})
 
         with self.assertLogs() as logs_context_manager:
-            with patch("octue.cloud.pub_sub.service.Topic", new=MockTopic):
-                with patch("octue.cloud.pub_sub.service.Subscription", new=MockSubscription):
-                    with patch("google.cloud.pubsub_v1.SubscriberClient", new=MockSubscriber):
-                        child.serve()
-
-                        self.ask_question_and_wait_for_answer(
-                            parent=parent,
-                            child=child,
-                            input_values={},
-                            input_manifest=None,
-                            subscribe_to_logs=True,
-                            service_name="my-super-service",
-                        )
-
-        error_logged = False
-
-        for record in logs_context_manager.records:
-            if (
+            child.serve()
+
+            self.ask_question_and_wait_for_answer(
+                parent=parent,
+                child=child,
+                input_values={},
+                input_manifest=None,
+                subscribe_to_logs=True,
+                service_name="my-super-service",
+            )
+
+        self.assertTrue(
+            any(
                 record.levelno == logging.ERROR
                 and "An example exception to log and forward to the parent." in record.message
                 and "This is an OSError" in record.exc_text
-            ):
-                error_logged = True
-                break
-
-        self.assertTrue(error_logged)
+                for record in logs_context_manager.records
+            )
+        )
 
     def test_with_monitor_message_handler(self):
         """Test that monitor messages can be sent from a child app and handled by the parent's monitor message handler."""
@@ -429,33 +590,17 @@ class TestService(BaseTestCase):
                 analysis.send_monitor_message({"status": "my first monitor message"})
                 analysis.send_monitor_message({"status": "my second monitor message"})
 
-            twine = """
-                {
-                    "input_values_schema": {"type": "object", "required": []},
-                    "monitor_message_schema": {
-                        "type": "object",
-                        "properties": {"status": {"type": "string"}},
-                        "required": ["status"]
-                    }
-                }
-            """
-
-            return Runner(app_src=mock_app, twine=twine).run
+            return Runner(app_src=mock_app, twine=load_twine(MONITOR_MESSAGE_TWINE)).run
 
         child = MockService(backend=BACKEND, run_function=create_run_function_with_monitoring())
         parent = MockService(backend=BACKEND, children={child.id: child})
 
-        with patch("octue.cloud.pub_sub.service.Topic", new=MockTopic):
-            with patch("octue.cloud.pub_sub.service.Subscription", new=MockSubscription):
-                with patch("google.cloud.pubsub_v1.SubscriberClient", new=MockSubscriber):
-                    child.serve()
+        child.serve()
 
-                    subscription, _ = parent.ask(child.id, input_values={})
+        subscription, _ = parent.ask(child.id, input_values={})
 
-                    monitoring_data = []
-                    parent.wait_for_answer(
-                        subscription, handle_monitor_message=lambda data: monitoring_data.append(data)
-                    )
+        monitoring_data = []
+        parent.wait_for_answer(subscription, handle_monitor_message=lambda data: monitoring_data.append(data))
 
         self.assertEqual(
             monitoring_data, [{"status": "my first monitor message"}, {"status": "my second monitor message"}]
@@ -472,36 +617,22 @@ class TestService(BaseTestCase):
                 analysis.send_monitor_message({"wrong": "my second monitor message"})
                 analysis.send_monitor_message({"status": "my third monitor message"})
 
-            twine = """
-                {
-                    "input_values_schema": {"type": "object", "required": []},
-                    "monitor_message_schema": {
-                        "type": "object",
-                        "properties": {"status": {"type": "string"}},
-                        "required": ["status"]
-                    }
-                }
-            """
-
-            return Runner(app_src=mock_app, twine=twine).run
+            return Runner(app_src=mock_app, twine=load_twine(MONITOR_MESSAGE_TWINE)).run
 
         child = MockService(backend=BACKEND, run_function=create_run_function_with_monitoring())
         parent = MockService(backend=BACKEND, children={child.id: child})
 
-        with patch("octue.cloud.pub_sub.service.Topic", new=MockTopic):
-            with patch("octue.cloud.pub_sub.service.Subscription", new=MockSubscription):
-                with patch("google.cloud.pubsub_v1.SubscriberClient", new=MockSubscriber):
-                    child.serve()
+        child.serve()
 
-                    subscription, _ = parent.ask(child.id, input_values={})
+        subscription, _ = parent.ask(child.id, input_values={})
 
-                    monitoring_data = []
+        monitoring_data = []
 
-                    with self.assertRaises(InvalidMonitorMessage):
-                        parent.wait_for_answer(
-                            subscription,
-                            handle_monitor_message=lambda data: monitoring_data.append(data),
-                        )
+        with self.assertRaises(InvalidMonitorMessage):
+            parent.wait_for_answer(
+                subscription,
+                handle_monitor_message=lambda data: monitoring_data.append(data),
+            )
 
         self.assertEqual(
             monitoring_data,
@@ -512,71 +643,41 @@ class TestService(BaseTestCase):
         """Test that a service can ask a question including an input_manifest to another service that is serving and
         receive an answer.
         """
-        child = self.make_new_child(BACKEND, run_function_returnee=MockAnalysis(), use_mock=True)
+        child = self.served_child
         parent = MockService(backend=BACKEND, children={child.id: child})
 
-        files = [
-            Datafile(path="gs://my-dataset/hello.txt", project_name="blah", hypothetical=True),
-            Datafile(path="gs://my-dataset/goodbye.csv", project_name="blah", hypothetical=True),
-        ]
-
-        input_manifest = Manifest(datasets={"my-dataset": Dataset(files=files)}, path="gs://my-dataset")
-
-        with patch("octue.cloud.pub_sub.service.Topic", new=MockTopic):
-            with patch("octue.cloud.pub_sub.service.Subscription", new=MockSubscription):
-                with patch("google.cloud.pubsub_v1.SubscriberClient", new=MockSubscriber):
-                    child.serve()
-
-                    answer = self.ask_question_and_wait_for_answer(
-                        parent=parent,
-                        child=child,
-                        input_values={},
-                        input_manifest=input_manifest,
-                    )
-
-        self.assertEqual(
-            answer,
-            {"output_values": MockAnalysis().output_values, "output_manifest": MockAnalysis().output_manifest},
+        answer = self.ask_question_and_wait_for_answer(
+            parent=parent,
+            child=child,
+            input_values={},
+            input_manifest=self.cloud_input_manifest,
         )
 
+        self.assertEqual(answer, EXPECTED_MOCK_ANALYSIS_ANSWER)
+
     def test_ask_with_input_manifest_and_no_input_values(self):
         """Test that a service can ask a question including an input manifest and no input values to another service
         that is serving and receive an answer.
         """
-        child = self.make_new_child(BACKEND, run_function_returnee=MockAnalysis(), use_mock=True)
+        child = self.served_child
         parent = MockService(backend=BACKEND, children={child.id: child})
 
-        files = [
-            Datafile(path="gs://my-dataset/hello.txt", project_name=TEST_PROJECT_NAME, hypothetical=True),
-            Datafile(path="gs://my-dataset/goodbye.csv", project_name=TEST_PROJECT_NAME, hypothetical=True),
-        ]
-
-        input_manifest = Manifest(datasets={"my-dataset": Dataset(files=files)}, path="gs://my-dataset")
-
-        with patch("octue.cloud.pub_sub.service.Topic", new=MockTopic):
-            with patch("octue.cloud.pub_sub.service.Subscription", new=MockSubscription):
-                with patch("google.cloud.pubsub_v1.SubscriberClient", new=MockSubscriber):
-                    child.serve()
-
-                    answer = self.ask_question_and_wait_for_answer(
-                        parent=parent,
-                        child=child,
-                        input_values=None,
-                        input_manifest=input_manifest,
-                    )
-
-        self.assertEqual(
-            answer,
-            {"output_values": MockAnalysis().output_values, "output_manifest": MockAnalysis().output_manifest},
+        answer = self.ask_question_and_wait_for_answer(
+            parent=parent,
+            child=child,
+            input_values=None,
+            input_manifest=self.cloud_input_manifest,
         )
 
+        self.assertEqual(answer, EXPECTED_MOCK_ANALYSIS_ANSWER)
+
     def test_ask_with_input_manifest_with_local_paths_raises_error(self):
         """Test that an error is raised if an input manifest whose datasets and/or files are not located in the cloud
         is used in a question.
         """
         with self.assertRaises(exceptions.FileLocationError):
             MockService(backend=BACKEND).ask(
-                service_id=str(uuid.uuid4()),
+                service_id=PLACEHOLDER_SERVICE_ID,
                 input_values={},
                 input_manifest=self.create_valid_manifest(),
             )
@@ -585,7 +686,9 @@ class TestService(BaseTestCase):
         """Test that an input manifest referencing local files can be used if the files can be accessed by the child and
         the `allow_local_files` parameter is `True`.
         """
-        temporary_local_path = tempfile.NamedTemporaryFile(delete=False).name
+        temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        temporary_local_path = os.path.join(temporary_directory.name, "local-file.txt")
 
         with open(temporary_local_path, "w") as f:
             f.write("This is a local file.")
@@ -603,100 +706,67 @@ class TestService(BaseTestCase):
         child = MockService(backend=BACKEND, run_function=run_function)
         parent = MockService(backend=BACKEND, children={child.id: child})
 
-        with patch("octue.cloud.pub_sub.service.Topic", new=MockTopic):
-            with patch("octue.cloud.pub_sub.service.Subscription", new=MockSubscription):
-                with patch("google.cloud.pubsub_v1.SubscriberClient", new=MockSubscriber):
-                    child.serve()
+        child.serve()
 
-                    answer = self.ask_question_and_wait_for_answer(
-                        parent=parent,
-                        child=child,
-                        input_values={},
-                        input_manifest=manifest,
-                        allow_local_files=True,
-                    )
+        answer = self.ask_question_and_wait_for_answer(
+            parent=parent,
+            child=child,
+            input_values={},
+            input_manifest=manifest,
+            allow_local_files=True,
+        )
 
         self.assertEqual(answer["output_values"], "This is a local file.")
 
     def test_ask_with_output_manifest(self):
         """Test that a service can receive an output manifest as part of the answer to a question."""
-        child = self.make_new_child(BACKEND, run_function_returnee=MockAnalysisWithOutputManifest(), use_mock=True)
+        child = self.make_new_child(BACKEND, run_function_returnee=MockAnalysisWithOutputManifest())
         parent = MockService(backend=BACKEND, children={child.id: child})
 
-        with patch("octue.cloud.pub_sub.service.Topic", new=MockTopic):
-            with patch("octue.cloud.pub_sub.service.Subscription", new=MockSubscription):
-                with patch("google.cloud.pubsub_v1.SubscriberClient", new=MockSubscriber):
-                    child.serve()
+        child.serve()
 
-                    answer = self.ask_question_and_wait_for_answer(
-                        parent=parent,
-                        child=child,
-                        input_values={},
-                        input_manifest=None,
-                    )
+        answer = self.ask_question_and_wait_for_answer(
+            parent=parent,
+            child=child,
+            input_values={},
+            input_manifest=None,
+        )
 
         self.assertEqual(answer["output_values"], MockAnalysisWithOutputManifest.output_values)
         self.assertEqual(answer["output_manifest"].id, MockAnalysisWithOutputManifest.output_manifest.id)
 
     def test_service_can_ask_multiple_questions(self):
         """Test that a service can ask multiple questions to the same server and expect replies to them all."""
-        child = self.make_new_child(BACKEND, run_function_returnee=MockAnalysis(), use_mock=True)
+        child = self.served_child
         parent = MockService(backend=BACKEND, children={child.id: child})
 
-        with patch("octue.cloud.pub_sub.service.Topic", new=MockTopic):
-            with patch("octue.cloud.pub_sub.service.Subscription", new=MockSubscription):
-                with patch("google.cloud.pubsub_v1.SubscriberClient", new=MockSubscriber):
-                    child.serve()
+        # Ask all the questions before waiting for any of the answers and then wait for the answers concurrently.
+        subscriptions = [parent.ask(service_id=child.id, input_values={})[0] for _ in range(5)]
 
-                    answers = []
-
-                    for i in range(5):
-                        answers.append(
-                            self.ask_question_and_wait_for_answer(
-                                parent=parent,
-                                child=child,
-                                input_values={},
-                                input_manifest=None,
-                            )
-                        )
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(subscriptions)) as executor:
+            answers = list(executor.map(parent.wait_for_answer, subscriptions))
 
         for answer in answers:
-            self.assertEqual(
-                answer,
-                {"output_values": MockAnalysis().output_values, "output_manifest": MockAnalysis().output_manifest},
-            )
+            self.assertEqual(answer, EXPECTED_MOCK_ANALYSIS_ANSWER)
 
     def test_service_can_ask_questions_to_multiple_servers(self):
         """Test that a service can ask questions to different servers and expect replies to them all."""
-        child_1 = self.make_new_child(BACKEND, run_function_returnee=MockAnalysis(), use_mock=True)
-        child_2 = self.make_new_child(BACKEND, run_function_returnee=DifferentMockAnalysis(), use_mock=True)
+        child_1 = self.make_new_child(BACKEND, run_function_returnee=MOCK_ANALYSIS)
+        child_2 = self.make_new_child(BACKEND, run_function_returnee=DifferentMockAnalysis())
 
         parent = MockService(backend=BACKEND, children={child_1.id: child_1, child_2.id: child_2})
 
-        with patch("octue.cloud.pub_sub.service.Topic", new=MockTopic):
-            with patch("octue.cloud.pub_sub.service.Subscription", new=MockSubscription):
-                with patch("google.cloud.pubsub_v1.SubscriberClient", new=MockSubscriber):
-                    child_1.serve()
-                    child_2.serve()
-
-                    answer_1 = self.ask_question_and_wait_for_answer(
-                        parent=parent,
-                        child=child_1,
-                        input_values={},
-                        input_manifest=None,
-                    )
-
-                    answer_2 = self.ask_question_and_wait_for_answer(
-                        parent=parent,
-                        child=child_2,
-                        input_values={},
-                        input_manifest=None,
-                    )
+        child_1.serve()
+        child_2.serve()
 
-        self.assertEqual(
-            answer_1,
-            {"output_values": MockAnalysis().output_values, "output_manifest": MockAnalysis().output_manifest},
-        )
+        # Ask the two children their questions concurrently as they're independent of each other.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            answer_1, answer_2 = executor.map(
+                functools.partial(self.ask_question_and_wait_for_answer, parent, input_values={}, input_manifest=None),
+                (child_1, child_2),
+            )
+
+        self.assertEqual(answer_1, EXPECTED_MOCK_ANALYSIS_ANSWER)
 
         self.assertEqual(
             answer_2,
@@ -708,7 +778,7 @@ class TestService(BaseTestCase):
 
     def test_server_can_ask_its_own_child_questions(self):
         """Test that a child can contact its own child while answering a question from a parent."""
-        child_of_child = self.make_new_child(BACKEND, run_function_returnee=DifferentMockAnalysis(), use_mock=True)
+        child_of_child = self.make_new_child(BACKEND, run_function_returnee=DifferentMockAnalysis())
 
         def child_run_function(analysis_id, input_values, input_manifest, analysis_log_handler, handle_monitor_message):
             subscription, _ = child.ask(service_id=child_of_child.id, input_values=input_values)
@@ -722,18 +792,15 @@ class TestService(BaseTestCase):
 
         parent = MockService(backend=BACKEND, children={child.id: child})
 
-        with patch("octue.cloud.pub_sub.service.Topic", new=MockTopic):
-            with patch("octue.cloud.pub_sub.service.Subscription", new=MockSubscription):
-                with patch("google.cloud.pubsub_v1.SubscriberClient", new=MockSubscriber):
-                    child.serve()
-                    child_of_child.serve()
+        child.serve()
+        child_of_child.serve()
 
-                    answer = self.ask_question_and_wait_for_answer(
-                        parent=parent,
-                        child=child,
-                        input_values={"question": "What does the child of the child say?"},
-                        input_manifest=None,
-                    )
+        answer = self.ask_question_and_wait_for_answer(
+            parent=parent,
+            child=child,
+            input_values={"question": "What does the child of the child say?"},
+            input_manifest=None,
+        )
 
         self.assertEqual(
             answer,
@@ -750,24 +817,26 @@ class TestService(BaseTestCase):
 
     def test_server_can_ask_its_own_children_questions(self):
         """Test that a child can contact more than one of its own children while answering a question from a parent."""
-        first_child_of_child = self.make_new_child(
-            BACKEND,
-            run_function_returnee=DifferentMockAnalysis(),
-            use_mock=True,
-        )
+        first_child_of_child = self.make_new_child(BACKEND, run_function_returnee=DifferentMockAnalysis())
 
-        second_child_of_child = self.make_new_child(BACKEND, run_function_returnee=MockAnalysis(), use_mock=True)
+        second_child_of_child = self.make_new_child(BACKEND, run_function_returnee=MOCK_ANALYSIS)
 
         def child_run_function(analysis_id, input_values, input_manifest, analysis_log_handler, handle_monitor_message):
-            subscription_1, _ = child.ask(service_id=first_child_of_child.id, input_values=input_values)
-            subscription_2, _ = child.ask(service_id=second_child_of_child.id, input_values=input_values)
-
-            return MockAnalysis(
-                output_values={
-                    "first_child_of_child": child.wait_for_answer(subscription_1),
-                    "second_child_of_child": child.wait_for_answer(subscription_2),
-                }
-            )
+            def ask_child_of_child(child_of_child):
+                subscription, _ = child.ask(service_id=child_of_child.id, input_values=input_values)
+                return child.wait_for_answer(subscription)
+
+            # Ask the children of the child their questions concurrently as they're independent of each other.
+            with concurrent.futures.ThreadPoolExecutor() as executor:
+                first_answer = executor.submit(ask_child_of_child, first_child_of_child)
+                second_answer = executor.submit(ask_child_of_child, second_child_of_child)
+
+                return MockAnalysis(
+                    output_values={
+                        "first_child_of_child": first_answer.result(),
+                        "second_child_of_child": second_answer.result(),
+                    }
+                )
 
         child = MockService(
             backend=BACKEND,
@@ -777,19 +846,16 @@ class TestService(BaseTestCase):
 
         parent = MockService(backend=BACKEND, children={child.id: child})
 
-        with patch("octue.cloud.pub_sub.service.Topic", new=MockTopic):
-            with patch("octue.cloud.pub_sub.service.Subscription", new=MockSubscription):
-                with patch("google.cloud.pubsub_v1.SubscriberClient", new=MockSubscriber):
-                    child.serve()
-                    first_child_of_child.serve()
-                    second_child_of_child.serve()
+        child.serve()
+        first_child_of_child.serve()
+        second_child_of_child.serve()
 
-                    answer = self.ask_question_and_wait_for_answer(
-                        parent=parent,
-                        child=child,
-                        input_values={"question": "What does the child of the child say?"},
-                        input_manifest=None,
-                    )
+        answer = self.ask_question_and_wait_for_answer(
+            parent=parent,
+            child=child,
+            input_values={"question": "What does the child of the child say?"},
+            input_manifest=None,
+        )
 
         self.assertEqual(
             answer,
@@ -799,10 +865,7 @@ class TestService(BaseTestCase):
                         "output_values": DifferentMockAnalysis.output_values,
                         "output_manifest": DifferentMockAnalysis.output_manifest,
                     },
-                    "second_child_of_child": {
-                        "output_values": MockAnalysis().output_values,
-                        "output_manifest": MockAnalysis().output_manifest,
-                    },
+                    "second_child_of_child": EXPECTED_MOCK_ANALYSIS_ANSWER,
                 },
                 "output_manifest": None,
             },
@@ -10,30 +10,45 @@ from octue.cloud import storage
 from octue.cloud.storage import GoogleCloudStorageClient
 from octue.exceptions import CloudStorageBucketNotFound
 from tests import TEST_BUCKET_NAME
-from tests.base import BaseTestCase
+from tests.base import BaseTestCase, get_storage_client
+
+
+JSON_CONTENTS = json.dumps({"height": 32})
+
+# Make the client send a checksum that won't match the uploaded data.
+INCORRECT_CHECKSUM_PATCH = patch.object(GoogleCloudStorageClient, "_compute_crc32c_checksum", return_value="L3eGig==")
 
 
 class TestGoogleCloudStorageClient(BaseTestCase):
     @classmethod
     def setUpClass(cls):
-        """Set up the class by adding a cloud filename and a storage client to access the cloud storage emulator.
+        """Set up the class by adding a cloud filename and path, a storage client to access the cloud storage emulator,
+        and a local file to upload. The local file is removed once the tests have finished.
 
         :return None:
         """
+        super().setUpClass()
+
         cls.FILENAME = "my_file.txt"
-        cls.storage_client = GoogleCloudStorageClient()
+        cls.CLOUD_PATH = storage.path.generate_gs_path(TEST_BUCKET_NAME, cls.FILENAME)
+        cls.storage_client = get_storage_client()
+
+        cls._temporary_directory = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(cls._temporary_directory.cleanup)
+        cls.LOCAL_UPLOAD_PATH = os.path.join(cls._temporary_directory.name, cls.FILENAME)
+
+        with open(cls.LOCAL_UPLOAD_PATH, "w") as f:
+            f.write("This is a test upload.")
 
     def test_create_bucket(self):
         """Test that a bucket can be created."""
         name = "bucket-of-sand"
-        self.assertIsNone(self.storage_client.client.lookup_bucket(name))
         self.storage_client.create_bucket(name)
         self.assertEqual(self.storage_client.client.lookup_bucket(name).name, name)
 
     def test_create_bucket_in_non_default_location(self):
         """Test that a bucket can be created in a non-default location."""
         name = "bucket-of-chocolate"
-        self.assertIsNone(self.storage_client.client.lookup_bucket(name))
         self.storage_client.create_bucket(name, location="EUROPE-WEST2")
         self.assertEqual(self.storage_client.client.lookup_bucket(name).name, name)
 
@@ -66,148 +81,118 @@ class TestGoogleCloudStorageClient(BaseTestCase):
 
     def test_upload_and_download_file(self):
         """Test that a file can be uploaded to Google Cloud storage and downloaded again."""
-        with tempfile.NamedTemporaryFile("w", delete=False) as temporary_file:
-            temporary_file.write("This is a test upload.")
-
-        self.storage_client.upload_file(
-            local_path=temporary_file.name, cloud_path=storage.path.generate_gs_path(TEST_BUCKET_NAME, self.FILENAME)
-        )
+        self.storage_client.upload_file(local_path=self.LOCAL_UPLOAD_PATH, cloud_path=self.CLOUD_PATH)
 
-        download_local_path = tempfile.NamedTemporaryFile().name
+        download_local_path = os.path.join(self._temporary_directory.name, "downloaded_file.txt")
 
-        self.storage_client.download_to_file(
-            cloud_path=storage.path.generate_gs_path(TEST_BUCKET_NAME, self.FILENAME), local_path=download_local_path
-        )
+        self.storage_client.download_to_file(cloud_path=self.CLOUD_PATH, local_path=download_local_path)
 
         with open(download_local_path) as f:
-            self.assertTrue("This is a test upload." in f.read())
+            self.assertIn("This is a test upload.", f.read())
 
     def test_upload_file_fails_if_checksum_is_not_correct(self):
         """Test that uploading a file fails if its checksum isn't the correct."""
-        with tempfile.NamedTemporaryFile("w", delete=False) as temporary_file:
-            temporary_file.write("This is a test upload.")
-
-        with patch(
-            "octue.cloud.storage.client.GoogleCloudStorageClient._compute_crc32c_checksum",
-            return_value="L3eGig==",
-        ):
-
+        with INCORRECT_CHECKSUM_PATCH:
             with self.assertRaises(google.api_core.exceptions.BadRequest) as e:
                 self.storage_client.upload_file(
-                    local_path=temporary_file.name,
-                    cloud_path=storage.path.generate_gs_path(TEST_BUCKET_NAME, self.FILENAME),
+                    local_path=self.LOCAL_UPLOAD_PATH,
+                    cloud_path=self.CLOUD_PATH,
                 )
 
-            self.assertTrue("doesn't match calculated CRC32C" in e.exception.message)
+            self.assertIn("doesn't match calculated CRC32C", e.exception.message)
 
     def test_upload_from_string(self):
         """Test that a string can be uploaded to Google Cloud storage as a file and downloaded again."""
-        self.storage_client.upload_from_string(
-            string=json.dumps({"height": 32}), cloud_path=storage.path.generate_gs_path(TEST_BUCKET_NAME, self.FILENAME)
-        )
+        self.storage_client.upload_from_string(string=JSON_CONTENTS, cloud_path=self.CLOUD_PATH)
 
         with tempfile.NamedTemporaryFile("w", delete=False) as temporary_file:
             self.storage_client.download_to_file(
-                cloud_path=storage.path.generate_gs_path(TEST_BUCKET_NAME, self.FILENAME),
+                cloud_path=self.CLOUD_PATH,
                 local_path=temporary_file.name,
             )
 
         with open(temporary_file.name) as f:
-            self.assertTrue('{"height": 32}' in f.read())
+            self.assertIn('{"height": 32}', f.read())
 
     def test_upload_from_string_fails_if_checksum_is_not_correct(self):
         """Test that uploading a string fails if its checksum isn't the correct."""
-        with patch(
-            "octue.cloud.storage.client.GoogleCloudStorageClient._compute_crc32c_checksum",
-            return_value="L3eGig==",
-        ):
+        with INCORRECT_CHECKSUM_PATCH:
             with self.assertRaises(google.api_core.exceptions.BadRequest) as e:
                 self.storage_client.upload_from_string(
                     string=json.dumps({"height": 15}),
-                    cloud_path=storage.path.generate_gs_path(TEST_BUCKET_NAME, self.FILENAME),
+                    cloud_path=self.CLOUD_PATH,
                 )
 
-            self.assertTrue("doesn't match calculated CRC32C" in e.exception.message)
+            self.assertIn("doesn't match calculated CRC32C", e.exception.message)
 
     def test_download_as_string(self):
         """Test that a file can be uploaded to Google Cloud storage and downloaded as a string."""
-        with tempfile.NamedTemporaryFile("w", delete=False) as temporary_file:
-            temporary_file.write("This is a test upload.")
-
-        self.storage_client.upload_file(
-            local_path=temporary_file.name, cloud_path=storage.path.generate_gs_path(TEST_BUCKET_NAME, self.FILENAME)
-        )
+        self.storage_client.upload_file(local_path=self.LOCAL_UPLOAD_PATH, cloud_path=self.CLOUD_PATH)
 
         self.assertEqual(
-            self.storage_client.download_as_string(storage.path.generate_gs_path(TEST_BUCKET_NAME, self.FILENAME)),
+            self.storage_client.download_as_string(self.CLOUD_PATH),
             "This is a test upload.",
         )
 
     def test_delete(self):
         """Test that a file can be deleted."""
-        self.storage_client.upload_from_string(
-            string=json.dumps({"height": 32}), cloud_path=storage.path.generate_gs_path(TEST_BUCKET_NAME, self.FILENAME)
-        )
+        self.storage_client.upload_from_string(string=JSON_CONTENTS, cloud_path=self.CLOUD_PATH)
 
         self.assertEqual(
             json.loads(
-                self.storage_client.download_as_string(storage.path.generate_gs_path(TEST_BUCKET_NAME, self.FILENAME)),
+                self.storage_client.download_as_string(self.CLOUD_PATH),
             ),
             {"height": 32},
         )
 
-        self.storage_client.delete(storage.path.generate_gs_path(TEST_BUCKET_NAME, self.FILENAME))
+        self.storage_client.delete(self.CLOUD_PATH)
 
         with self.assertRaises(google.api_core.exceptions.NotFound):
-            self.storage_client.download_as_string(storage.path.generate_gs_path(TEST_BUCKET_NAME, self.FILENAME))
+            self.storage_client.download_as_string(self.CLOUD_PATH)
 
     def test_scandir(self):
         """Test that Google Cloud storage "directories"' contents can be listed."""
         directory_path = storage.path.join("my", "path")
 
         self.storage_client.upload_from_string(
-            string=json.dumps({"height": 32}),
+            string=JSON_CONTENTS,
             cloud_path=storage.path.generate_gs_path(TEST_BUCKET_NAME, directory_path, self.FILENAME),
         )
 
-        contents = list(
-            self.storage_client.scandir(cloud_path=storage.path.generate_gs_path(TEST_BUCKET_NAME, directory_path))
-        )
-        self.assertEqual(len(contents), 1)
-        self.assertEqual(contents[0].name, storage.path.join(directory_path, self.FILENAME))
+        blobs = self.storage_client.scandir(cloud_path=storage.path.generate_gs_path(TEST_BUCKET_NAME, directory_path))
+        self.assertEqual(next(blobs).name, storage.path.join(directory_path, self.FILENAME))
+        self.assertIsNone(next(blobs, None))
 
     def test_scandir_with_cloud_path(self):
         """Test that Google Cloud storage "directories"' contents can be listed when a cloud path is used."""
         cloud_directory_path = storage.path.generate_gs_path(TEST_BUCKET_NAME, "a", "path")
 
         self.storage_client.upload_from_string(
-            string=json.dumps({"height": 32}), cloud_path=storage.path.join(cloud_directory_path, self.FILENAME)
+            string=JSON_CONTENTS, cloud_path=storage.path.join(cloud_directory_path, self.FILENAME)
         )
 
-        contents = list(self.storage_client.scandir(cloud_directory_path))
-        self.assertEqual(len(contents), 1)
-        self.assertEqual(contents[0].name, "a/path/my_file.txt")
+        blobs = self.storage_client.scandir(cloud_directory_path)
+        self.assertEqual(next(blobs).name, "a/path/my_file.txt")
+        self.assertIsNone(next(blobs, None))
 
     def test_scandir_with_empty_directory(self):
         """Test that an empty directory shows as such."""
         directory_path = storage.path.join("another", "path")
-        contents = list(
-            self.storage_client.scandir(cloud_path=storage.path.generate_gs_path(TEST_BUCKET_NAME, directory_path))
-        )
-        self.assertEqual(len(contents), 0)
+        blobs = self.storage_client.scandir(cloud_path=storage.path.generate_gs_path(TEST_BUCKET_NAME, directory_path))
+        self.assertIsNone(next(blobs, None))
 
     def test_scandir_with_directory_of_subdirectories_includes_subdirectories_by_default(self):
         """Test that subdirectories of the given directory are included by scandir by default."""
         directory_path = storage.path.join("the", "path")
 
         self.storage_client.upload_from_string(
-            string=json.dumps({"height": 32}),
+            string=JSON_CONTENTS,
             cloud_path=storage.path.generate_gs_path(TEST_BUCKET_NAME, directory_path, self.FILENAME),
         )
 
         # Add a file in a subdirectory.
         self.storage_client.upload_from_string(
-            string=json.dumps({"height": 32}),
+            string=JSON_CONTENTS,
             cloud_path=storage.path.generate_gs_path(TEST_BUCKET_NAME, directory_path, "sub_directory", "blah.txt"),
         )
 
@@ -229,49 +214,42 @@ class TestGoogleCloudStorageClient(BaseTestCase):
         directory_path = storage.path.join("my", "path")
 
         self.storage_client.upload_from_string(
-            string=json.dumps({"height": 32}),
+            string=JSON_CONTENTS,
             cloud_path=storage.path.generate_gs_path(TEST_BUCKET_NAME, directory_path, self.FILENAME),
         )
 
         # Add a file in a subdirectory.
         self.storage_client.upload_from_string(
-            string=json.dumps({"height": 32}),
+            string=JSON_CONTENTS,
             cloud_path=storage.path.generate_gs_path(TEST_BUCKET_NAME, directory_path, "sub_directory", "blah.txt"),
         )
 
-        contents = list(
-            self.storage_client.scandir(
-                cloud_path=storage.path.generate_gs_path(TEST_BUCKET_NAME, directory_path), recursive=False
-            )
+        blobs = self.storage_client.scandir(
+            cloud_path=storage.path.generate_gs_path(TEST_BUCKET_NAME, directory_path), recursive=False
         )
-        self.assertEqual(len(contents), 1)
-        self.assertEqual(contents[0].name, storage.path.join(directory_path, self.FILENAME))
+
+        self.assertEqual(next(blobs).name, storage.path.join(directory_path, self.FILENAME))
+        self.assertIsNone(next(blobs, None))
 
     def test_get_metadata(self):
         """Test that file metadata can be retrieved."""
-        self.storage_client.upload_from_string(
-            string=json.dumps({"height": 32}), cloud_path=storage.path.generate_gs_path(TEST_BUCKET_NAME, self.FILENAME)
-        )
+        self.storage_client.upload_from_string(string=JSON_CONTENTS, cloud_path=self.CLOUD_PATH)
 
-        metadata = self.storage_client.get_metadata(
-            cloud_path=storage.path.generate_gs_path(TEST_BUCKET_NAME, self.FILENAME)
-        )
+        metadata = self.storage_client.get_metadata(cloud_path=self.CLOUD_PATH)
 
         self.assertTrue(len(metadata) > 0)
 
     def test_get_metadata_with_gs_path(self):
         """Test that file metadata can be retrieved when a GS path is used."""
         gs_path = f"gs://{TEST_BUCKET_NAME}/{self.FILENAME}"
-        self.storage_client.upload_from_string(string=json.dumps({"height": 32}), cloud_path=gs_path)
+        self.storage_client.upload_from_string(string=JSON_CONTENTS, cloud_path=gs_path)
 
         metadata = self.storage_client.get_metadata(gs_path)
         self.assertTrue(len(metadata) > 0)
 
     def test_get_metadata_does_not_fail_on_non_json_encoded_metadata(self):
         """Test that non-JSON-encoded metadata does not cause getting of metadata to fail."""
-        self.storage_client.upload_from_string(
-            string="some stuff", cloud_path=storage.path.generate_gs_path(TEST_BUCKET_NAME, self.FILENAME)
-        )
+        self.storage_client.upload_from_string(string="some stuff", cloud_path=self.CLOUD_PATH)
 
         # Manually add metadata that isn't JSON encoded (the above method JSON-encodes any metadata given to it).
         bucket = self.storage_client.client.get_bucket(TEST_BUCKET_NAME)
@@ -279,9 +257,7 @@ class TestGoogleCloudStorageClient(BaseTestCase):
         blob.metadata = {"this": "is-not-json-encoded"}
         blob.patch()
 
-        metadata = self.storage_client.get_metadata(
-            cloud_path=storage.path.generate_gs_path(TEST_BUCKET_NAME, self.FILENAME)
-        )
+        metadata = self.storage_client.get_metadata(cloud_path=self.CLOUD_PATH)
 
         self.assertEqual(metadata["custom_metadata"], {"this": "is-not-json-encoded"})
 
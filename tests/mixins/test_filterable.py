@@ -125,40 +125,42 @@ class TestFilterable(BaseTestCase):
     def test_number_filters_with_integers_and_floats(self):
         """Test that the number filters work as expected for integers and floats."""
         for age in (5, 5.2):
-            filterable_thing = FilterableSubclass(age=age)
-            self.assertTrue(filterable_thing.satisfies(age__equals=age))
-            self.assertFalse(filterable_thing.satisfies(age__equals=63))
-            self.assertTrue(filterable_thing.satisfies(age__not_equals=63))
-            self.assertFalse(filterable_thing.satisfies(age__not_equals=age))
-            self.assertTrue(filterable_thing.satisfies(age__lt=6))
-            self.assertFalse(filterable_thing.satisfies(age__lt=0))
-            self.assertTrue(filterable_thing.satisfies(age__lte=age))
-            self.assertFalse(filterable_thing.satisfies(age__lte=0))
-            self.assertTrue(filterable_thing.satisfies(age__gt=4))
-            self.assertFalse(filterable_thing.satisfies(age__gt=63))
-            self.assertTrue(filterable_thing.satisfies(age__gte=age))
-            self.assertFalse(filterable_thing.satisfies(age__gte=63))
-            self.assertTrue(filterable_thing.satisfies(age__is=age))
-            self.assertFalse(filterable_thing.satisfies(age__is=63))
-            self.assertTrue(filterable_thing.satisfies(age__is_not=63))
-            self.assertFalse(filterable_thing.satisfies(age__is_not=age))
-            self.assertTrue(filterable_thing.satisfies(age__in_range=(0, 10)))
-            self.assertFalse(filterable_thing.satisfies(age__in_range=(0, 3)))
-            self.assertTrue(filterable_thing.satisfies(age__not_in_range=(0, 3)))
-            self.assertFalse(filterable_thing.satisfies(age__not_in_range=(0, 10)))
+            with self.subTest(age=age):
+                filterable_thing = FilterableSubclass(age=age)
+                self.assertTrue(filterable_thing.satisfies(age__equals=age))
+                self.assertFalse(filterable_thing.satisfies(age__equals=63))
+                self.assertTrue(filterable_thing.satisfies(age__not_equals=63))
+                self.assertFalse(filterable_thing.satisfies(age__not_equals=age))
+                self.assertTrue(filterable_thing.satisfies(age__lt=6))
+                self.assertFalse(filterable_thing.satisfies(age__lt=0))
+                self.assertTrue(filterable_thing.satisfies(age__lte=age))
+                self.assertFalse(filterable_thing.satisfies(age__lte=0))
+                self.assertTrue(filterable_thing.satisfies(age__gt=4))
+                self.assertFalse(filterable_thing.satisfies(age__gt=63))
+                self.assertTrue(filterable_thing.satisfies(age__gte=age))
+                self.assertFalse(filterable_thing.satisfies(age__gte=63))
+                self.assertTrue(filterable_thing.satisfies(age__is=age))
+                self.assertFalse(filterable_thing.satisfies(age__is=63))
+                self.assertTrue(filterable_thing.satisfies(age__is_not=63))
+                self.assertFalse(filterable_thing.satisfies(age__is_not=age))
+                self.assertTrue(filterable_thing.satisfies(age__in_range=(0, 10)))
+                self.assertFalse(filterable_thing.satisfies(age__in_range=(0, 3)))
+                self.assertTrue(filterable_thing.satisfies(age__not_in_range=(0, 3)))
+                self.assertFalse(filterable_thing.satisfies(age__not_in_range=(0, 10)))
 
     def test_iterable_filters(self):
         """Test that the iterable filters work as expected with lists, sets, and tuples."""
         for iterable in ([1, 2, 3], {1, 2, 3}, (1, 2, 3)):
-            filterable_thing = FilterableSubclass(iterable=iterable)
-            self.assertTrue(filterable_thing.satisfies(iterable__contains=1))
-            self.assertFalse(filterable_thing.satisfies(iterable__contains=5))
-            self.assertTrue(filterable_thing.satisfies(iterable__not_contains=5))
-            self.assertFalse(filterable_thing.satisfies(iterable__not_contains=1))
-            self.assertTrue(filterable_thing.satisfies(iterable__is=iterable))
-            self.assertFalse(filterable_thing.satisfies(iterable__is=None))
-            self.assertTrue(filterable_thing.satisfies(iterable__is_not=None))
-            self.assertFalse(filterable_thing.satisfies(iterable__is_not=iterable))
+            with self.subTest(iterable=iterable):
+                filterable_thing = FilterableSubclass(iterable=iterable)
+                self.assertTrue(filterable_thing.satisfies(iterable__contains=1))
+                self.assertFalse(filterable_thing.satisfies(iterable__contains=5))
+                self.assertTrue(filterable_thing.satisfies(iterable__not_contains=5))
+                self.assertFalse(filterable_thing.satisfies(iterable__not_contains=1))
+                self.assertTrue(filterable_thing.satisfies(iterable__is=iterable))
+                self.assertFalse(filterable_thing.satisfies(iterable__is=None))
+                self.assertTrue(filterable_thing.satisfies(iterable__is_not=None))
+                self.assertFalse(filterable_thing.satisfies(iterable__is_not=iterable))
 
     def test_label_set_filters(self):
         """Test the filters for Labelset."""
@@ -180,68 +182,71 @@ class TestFilterable(BaseTestCase):
         """Test that datetime filters work as expected."""
         my_datetime = datetime(2000, 1, 1)
         filterable_thing = FilterableSubclass(timestamp=my_datetime)
-        self.assertTrue(filterable_thing.satisfies(timestamp__equals=my_datetime))
-        self.assertFalse(filterable_thing.satisfies(timestamp__equals=datetime(2, 2, 2)))
-        self.assertTrue(filterable_thing.satisfies(timestamp__not_equals=datetime(2, 2, 2)))
-        self.assertFalse(filterable_thing.satisfies(timestamp__not_equals=my_datetime))
-        self.assertTrue(filterable_thing.satisfies(timestamp__is=my_datetime))
-        self.assertFalse(filterable_thing.satisfies(timestamp__is=datetime(2, 2, 2)))
-        self.assertTrue(filterable_thing.satisfies(timestamp__is_not=datetime(2, 2, 2)))
-        self.assertFalse(filterable_thing.satisfies(timestamp__is_not=my_datetime))
-        self.assertTrue(filterable_thing.satisfies(timestamp__gt=datetime(1900, 1, 2)))
-        self.assertFalse(filterable_thing.satisfies(timestamp__gt=datetime(3000, 1, 2)))
-        self.assertTrue(filterable_thing.satisfies(timestamp__gte=my_datetime))
-        self.assertFalse(filterable_thing.satisfies(timestamp__gte=datetime(3000, 1, 2)))
-        self.assertTrue(filterable_thing.satisfies(timestamp__lt=datetime(3000, 1, 2)))
-        self.assertFalse(filterable_thing.satisfies(timestamp__lt=datetime(1990, 1, 2)))
-        self.assertTrue(filterable_thing.satisfies(timestamp__lte=my_datetime))
-        self.assertFalse(filterable_thing.satisfies(timestamp__lte=datetime(1900, 1, 2)))
-        self.assertTrue(filterable_thing.satisfies(timestamp__in_range=(datetime(1900, 1, 2), datetime(3000, 1, 2))))
-        self.assertFalse(filterable_thing.satisfies(timestamp__in_range=(datetime(2100, 1, 2), datetime(3000, 1, 2))))
-        self.assertTrue(
-            filterable_thing.satisfies(timestamp__not_in_range=(datetime(2100, 1, 2), datetime(3000, 1, 2)))
-        )
-        self.assertFalse(
-            filterable_thing.satisfies(timestamp__not_in_range=(datetime(1900, 1, 2), datetime(3000, 1, 2)))
-        )
-        self.assertTrue(filterable_thing.satisfies(timestamp__year_equals=2000))
-        self.assertFalse(filterable_thing.satisfies(timestamp__year_equals=3000))
-        self.assertTrue(filterable_thing.satisfies(timestamp__year_in={2000, 3000, 4000}))
-        self.assertFalse(filterable_thing.satisfies(timestamp__year_in={3000, 4000}))
-        self.assertTrue(filterable_thing.satisfies(timestamp__month_equals=1))
-        self.assertFalse(filterable_thing.satisfies(timestamp__month_equals=9))
-        self.assertTrue(filterable_thing.satisfies(timestamp__month_in={1, 2, 3}))
-        self.assertFalse(filterable_thing.satisfies(timestamp__month_in={2, 3}))
-        self.assertTrue(filterable_thing.satisfies(timestamp__day_equals=1))
-        self.assertFalse(filterable_thing.satisfies(timestamp__day_equals=2))
-        self.assertTrue(filterable_thing.satisfies(timestamp__day_in={1, 2, 3}))
-        self.assertFalse(filterable_thing.satisfies(timestamp__day_in={2, 3}))
-        self.assertTrue(filterable_thing.satisfies(timestamp__weekday_equals=5))
-        self.assertFalse(filterable_thing.satisfies(timestamp__weekday_equals=3))
-        self.assertTrue(filterable_thing.satisfies(timestamp__weekday_in={5, 6, 7}))
-        self.assertFalse(filterable_thing.satisfies(timestamp__weekday_in={6, 7}))
-        self.assertTrue(filterable_thing.satisfies(timestamp__iso_weekday_equals=6))
-        self.assertFalse(filterable_thing.satisfies(timestamp__iso_weekday_equals=4))
-        self.assertTrue(filterable_thing.satisfies(timestamp__iso_weekday_in={5, 6, 7}))
-        self.assertFalse(filterable_thing.satisfies(timestamp__iso_weekday_in={7, 8}))
-        self.assertTrue(filterable_thing.satisfies(timestamp__time_equals=time(0, 0, 0)))
-        self.assertFalse(filterable_thing.satisfies(timestamp__time_equals=time(1, 2, 3)))
-        self.assertTrue(filterable_thing.satisfies(timestamp__hour_equals=0))
-        self.assertFalse(filterable_thing.satisfies(timestamp__hour_equals=1))
-        self.assertTrue(filterable_thing.satisfies(timestamp__hour_in={0, 1, 2}))
-        self.assertFalse(filterable_thing.satisfies(timestamp__hour_in={1, 2}))
-        self.assertTrue(filterable_thing.satisfies(timestamp__minute_equals=0))
-        self.assertFalse(filterable_thing.satisfies(timestamp__minute_equals=1))
-        self.assertTrue(filterable_thing.satisfies(timestamp__minute_in={0, 1, 2}))
-        self.assertFalse(filterable_thing.satisfies(timestamp__minute_in={1, 2}))
-        self.assertTrue(filterable_thing.satisfies(timestamp__second_equals=0))
-        self.assertFalse(filterable_thing.satisfies(timestamp__second_equals=1))
-        self.assertTrue(filterable_thing.satisfies(timestamp__second_in={0, 1, 2}))
-        self.assertFalse(filterable_thing.satisfies(timestamp__second_in={1, 2}))
-        self.assertTrue(filterable_thing.satisfies(timestamp__in_date_range=(date(1000, 1, 4), date(3000, 7, 10))))
-        self.assertFalse(filterable_thing.satisfies(timestamp__in_date_range=(date(2000, 1, 4), date(3000, 7, 10))))
-        self.assertTrue(filterable_thing.satisfies(timestamp__in_time_range=(time(0, 0, 0), time(13, 2, 22))))
-        self.assertFalse(filterable_thing.satisfies(timestamp__in_time_range=(time(0, 0, 1), time(13, 2, 22))))
+
+        for filter_name, filter_value, expected_result in (
+            ("equals", my_datetime, True),
+            ("equals", datetime(2, 2, 2), False),
+            ("not_equals", datetime(2, 2, 2), True),
+            ("not_equals", my_datetime, False),
+            ("is", my_datetime, True),
+            ("is", datetime(2, 2, 2), False),
+            ("is_not", datetime(2, 2, 2), True),
+            ("is_not", my_datetime, False),
+            ("gt", datetime(1900, 1, 2), True),
+            ("gt", datetime(3000, 1, 2), False),
+            ("gte", my_datetime, True),
+            ("gte", datetime(3000, 1, 2), False),
+            ("lt", datetime(3000, 1, 2), True),
+            ("lt", datetime(1990, 1, 2), False),
+            ("lte", my_datetime, True),
+            ("lte", datetime(1900, 1, 2), False),
+            ("in_range", (datetime(1900, 1, 2), datetime(3000, 1, 2)), True),
+            ("in_range", (datetime(2100, 1, 2), datetime(3000, 1, 2)), False),
+            ("not_in_range", (datetime(2100, 1, 2), datetime(3000, 1, 2)), True),
+            ("not_in_range", (datetime(1900, 1, 2), datetime(3000, 1, 2)), False),
+            ("year_equals", 2000, True),
+            ("year_equals", 3000, False),
+            ("year_in", {2000, 3000, 4000}, True),
+            ("year_in", {3000, 4000}, False),
+            ("month_equals", 1, True),
+            ("month_equals", 9, False),
+            ("month_in", {1, 2, 3}, True),
+            ("month_in", {2, 3}, False),
+            ("day_equals", 1, True),
+            ("day_equals", 2, False),
+            ("day_in", {1, 2, 3}, True),
+            ("day_in", {2, 3}, False),
+            ("weekday_equals", 5, True),
+            ("weekday_equals", 3, False),
+            ("weekday_in", {5, 6, 7}, True),
+            ("weekday_in", {6, 7}, False),
+            ("iso_weekday_equals", 6, True),
+            ("iso_weekday_equals", 4, False),
+            ("iso_weekday_in", {5, 6, 7}, True),
+            ("iso_weekday_in", {7, 8}, False),
+            ("time_equals", time(0, 0, 0), True),
+            ("time_equals", time(1, 2, 3), False),
+            ("hour_equals", 0, True),
+            ("hour_equals", 1, False),
+            ("hour_in", {0, 1, 2}, True),
+            ("hour_in", {1, 2}, False),
+            ("minute_equals", 0, True),
+            ("minute_equals", 1, False),
+            ("minute_in", {0, 1, 2}, True),
+            ("minute_in", {1, 2}, False),
+            ("second_equals", 0, True),
+            ("second_equals", 1, False),
+            ("second_in", {0, 1, 2}, True),
+            ("second_in", {1, 2}, False),
+            ("in_date_range", (date(1000, 1, 4), date(3000, 7, 10)), True),
+            ("in_date_range", (date(2000, 1, 4), date(3000, 7, 10)), False),
+            ("in_time_range", (time(0, 0, 0), time(13, 2, 22)), True),
+            ("in_time_range", (time(0, 0, 1), time(13, 2, 22)), False),
+        ):
+            with self.subTest(filter_name=filter_name, filter_value=filter_value):
+                self.assertEqual(
+                    filterable_thing.satisfies(**{f"timestamp__{filter_name}": filter_value}), expected_result
+                )
 
     def test_filtering_different_attributes_on_same_instance(self):
         """Ensure all filterable attributes on an instance can be checked for filter satisfaction."""
@@ -6,6 +6,9 @@ from twined import Twine
 from ..base import BaseTestCase
 
 
+HASH_ATTRIBUTE_NAMES = tuple(f"{strand_name}_hash" for strand_name in HASH_FUNCTIONS)
+
+
 class AnalysisTestCase(BaseTestCase):
     def test_instantiate_analysis(self):
         """Ensures that the base analysis class can be instantiated"""
@@ -18,6 +21,12 @@ class AnalysisTestCase(BaseTestCase):
         analysis = Analysis(twine=Twine(source="{}"))
         self.assertEqual(analysis.__class__.__name__, "Analysis")
 
+    def test_twine_source_is_parsed_when_twine_is_first_accessed(self):
+        """Test that twine source given to an analysis is parsed into a `Twine` instance when the twine is accessed."""
+        analysis = Analysis(twine='{"monitor_message_schema": {}}')
+        self.assertIsInstance(analysis.twine, Twine)
+        self.assertIs(analysis.twine, analysis.twine)
+
     def test_non_existent_attributes_cannot_be_retrieved(self):
         """Ensure attributes that don't exist on Analysis aren't retrieved as None and instead raise an error. See
         https://github.com/octue/octue-sdk-python/issues/45 for reasoning behind adding this.
@@ -30,8 +39,8 @@ class AnalysisTestCase(BaseTestCase):
     def test_analysis_hash_attributes_are_none_when_no_relevant_strands(self):
         """Ensures that the hash attributes of Analysis instances are None if none of the relevant strands are provided"""
         analysis = Analysis(twine="{}")
-        for strand_name in HASH_FUNCTIONS:
-            self.assertIsNone(getattr(analysis, f"{strand_name}_hash"))
+        for hash_attribute_name in HASH_ATTRIBUTE_NAMES:
+            self.assertIsNone(getattr(analysis, hash_attribute_name))
 
     def test_analysis_hash_attributes_are_populated_when_relevant_strands_are_present(self):
         """Ensures that the hash attributes of Analysis instances are valid if the relevant strands are provided."""
@@ -43,8 +52,8 @@ class AnalysisTestCase(BaseTestCase):
             input_manifest=self.create_valid_manifest(),
         )
 
-        for strand_name in HASH_FUNCTIONS:
-            hash_ = getattr(analysis, f"{strand_name}_hash")
+        for hash_attribute_name in HASH_ATTRIBUTE_NAMES:
+            hash_ = getattr(analysis, hash_attribute_name)
             self.assertTrue(isinstance(hash_, str))
             self.assertTrue(len(hash_) == 8)
 
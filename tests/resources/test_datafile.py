@@ -2,6 +2,7 @@ import copy
 import json
 import os
 import tempfile
+import time
 import uuid
 from datetime import datetime, timezone
 from unittest.mock import patch
@@ -11,14 +12,16 @@ import pkg_resources
 
 from octue import exceptions
 from octue.cloud import storage
-from octue.cloud.storage import GoogleCloudStorageClient
 from octue.mixins import MixinBase, Pathable
-from octue.resources.datafile import Datafile
+from octue.resources.datafile import Datafile, _calculate_cached_hash, _calculate_file_hash, calculate_hash
 from octue.resources.label import LabelSet
 from octue.resources.tag import TagDict
-from tests import TEST_BUCKET_NAME
+from tests import TEST_BUCKET_NAME, TESTS_DIR
 
-from ..base import BaseTestCase
+from ..base import BaseTestCase, get_storage_client
+
+
+JSON_CONTENTS = json.dumps({"height": 32})
 
 
 class MyPathable(Pathable, MixinBase):
@@ -26,14 +29,28 @@ class MyPathable(Pathable, MixinBase):
 
 
 class TestDatafile(BaseTestCase):
-    def setUp(self):
-        """Set up the test class by adding an example `path_from` and `path` to it.
+    @classmethod
+    def setUpClass(cls):
+        """Set up the test class by adding an example `path_from` and `path` to it and uploading a cloud file once for
+        the tests that only read from the cloud rather than uploading a new one in each. The cloud file is deleted once
+        the tests have finished.
 
         :return None:
         """
-        super().setUp()
-        self.path_from = MyPathable(path=os.path.join(self.data_path, "basic_files", "configuration", "test-dataset"))
-        self.path = os.path.join("path-within-dataset", "a_test_file.csv")
+        super().setUpClass()
+
+        cls.path_from = MyPathable(path=os.path.join(TESTS_DIR, "data", "basic_files", "configuration", "test-dataset"))
+        cls.path = os.path.join("path-within-dataset", "a_test_file.csv")
+
+        cls.READ_ONLY_CLOUD_FILE_CONTENTS = "some text"
+        cls.READ_ONLY_CLOUD_PATH = storage.path.generate_gs_path(TEST_BUCKET_NAME, "read_only_cloud_file.txt")
+
+        get_storage_client().upload_from_string(
+            string=cls.READ_ONLY_CLOUD_FILE_CONTENTS,
+            cloud_path=cls.READ_ONLY_CLOUD_PATH,
+        )
+
+        cls.addClassCleanup(get_storage_client().delete, cloud_path=cls.READ_ONLY_CLOUD_PATH)
 
     def create_valid_datafile(self):
         """Create a datafile with its `path_from` and `path` attributes set to valid values.
@@ -174,6 +191,79 @@ class TestDatafile(BaseTestCase):
         second_file = copy.deepcopy(first_file)
         self.assertEqual(first_file.hash_value, second_file.hash_value)
 
+    def test_hash_value_changes_when_file_is_rewritten_with_same_size(self):
+        """Ensure a datafile's hash is recalculated when its file is changed, even if its size stays the same."""
+        with tempfile.NamedTemporaryFile("w", delete=False) as temporary_file:
+            temporary_file.write("hello")
+
+        self.addCleanup(os.remove, temporary_file.name)
+
+        datafile = Datafile(path=temporary_file.name)
+        original_hash = datafile.hash_value
+
+        with open(temporary_file.name, "w") as f:
+            f.write("world")
+
+        self.assertNotEqual(datafile.hash_value, original_hash)
+
+    def test_hash_of_file_not_modified_recently_is_cached(self):
+        """Test that the hash of a file that hasn't been modified recently is only calculated once."""
+        path = self._write_backdated_file("hello", seconds_ago=10)
+        _calculate_cached_hash.cache_clear()
+
+        with patch(
+            "octue.resources.datafile._calculate_file_hash",
+            wraps=_calculate_file_hash,
+        ) as mock_calculate_file_hash:
+            first_hash = calculate_hash(path).digest()
+            second_hash = calculate_hash(path).digest()
+
+        self.assertEqual(first_hash, second_hash)
+        mock_calculate_file_hash.assert_called_once()
+
+    def test_hash_of_recently_modified_file_is_not_cached(self):
+        """Test that the hash of a file modified within the last second is recalculated each time it's requested."""
+        path = self._write_backdated_file("hello", seconds_ago=0)
+
+        with patch(
+            "octue.resources.datafile._calculate_file_hash",
+            wraps=_calculate_file_hash,
+        ) as mock_calculate_file_hash:
+            calculate_hash(path)
+            calculate_hash(path)
+
+        self.assertEqual(mock_calculate_file_hash.call_count, 2)
+
+    def test_cached_hash_is_invalidated_when_file_changes(self):
+        """Test that a cached file hash isn't used once the file's contents (and so its stat values) have changed."""
+        path = self._write_backdated_file("hello", seconds_ago=20)
+        original_hash = calculate_hash(path).digest()
+
+        self._write_backdated_file("world", seconds_ago=10, path=path)
+        self.assertNotEqual(calculate_hash(path).digest(), original_hash)
+
+    def _write_backdated_file(self, contents, seconds_ago, path=None):
+        """Write the contents to a file and set its access and modification times to the given number of seconds ago.
+        If no path is given, a new temporary file is created and removed when the test finishes.
+
+        :param str contents:
+        :param float seconds_ago:
+        :param str|None path:
+        :return str: the path of the file
+        """
+        if path is None:
+            with tempfile.NamedTemporaryFile("w", delete=False) as temporary_file:
+                path = temporary_file.name
+
+            self.addCleanup(os.remove, path)
+
+        with open(path, "w") as f:
+            f.write(contents)
+
+        timestamp = time.time_ns() - int(seconds_ago * 1e9)
+        os.utime(path, ns=(timestamp, timestamp))
+        return path
+
     def test_exists_in_cloud(self):
         """Test whether it can be determined that a datafile exists in the cloud or not."""
         self.assertFalse(self.create_valid_datafile().exists_in_cloud)
@@ -184,8 +274,7 @@ class TestDatafile(BaseTestCase):
         self.assertTrue(self.create_valid_datafile().exists_locally)
         self.assertFalse(Datafile(path="gs://hello/file.txt", hypothetical=True).exists_locally)
 
-        datafile, _ = self.create_datafile_in_cloud()
-        new_datafile = Datafile(datafile.cloud_path)
+        new_datafile = Datafile(self.READ_ONLY_CLOUD_PATH)
 
         # Ensure the datafile exists locally as well as in the cloud.
         new_datafile.download()
@@ -195,7 +284,7 @@ class TestDatafile(BaseTestCase):
         """Test that a Datafile can be constructed from a bare Google Cloud Storage object with no custom metadata."""
         path = storage.path.generate_gs_path(TEST_BUCKET_NAME, "file_to_upload.txt")
 
-        GoogleCloudStorageClient().upload_from_string(string=json.dumps({"height": 32}), cloud_path=path)
+        get_storage_client().upload_from_string(string=JSON_CONTENTS, cloud_path=path)
 
         datafile = Datafile(path=path)
 
@@ -212,8 +301,8 @@ class TestDatafile(BaseTestCase):
         """
         path = storage.path.generate_gs_path(TEST_BUCKET_NAME, "file_to_upload.txt")
 
-        GoogleCloudStorageClient().upload_from_string(
-            string=json.dumps({"height": 32}),
+        get_storage_client().upload_from_string(
+            string=JSON_CONTENTS,
             cloud_path=path,
         )
 
@@ -328,9 +417,8 @@ class TestDatafile(BaseTestCase):
 
     def test_cloud_path(self):
         """Test that the cloud path property gives the right path."""
-        datafile, _ = self.create_datafile_in_cloud()
-        new_datafile = Datafile(path=datafile.cloud_path)
-        self.assertEqual(new_datafile.cloud_path, datafile.cloud_path)
+        datafile = Datafile(path=self.READ_ONLY_CLOUD_PATH)
+        self.assertEqual(datafile.cloud_path, self.READ_ONLY_CLOUD_PATH)
 
     def test_cloud_path_is_none_for_local_files(self):
         """Test that the cloud path property is `None` for local-only datafiles."""
@@ -342,16 +430,14 @@ class TestDatafile(BaseTestCase):
 
     def test_local_path(self):
         """Test that a file in the cloud can be temporarily downloaded and its local path returned."""
-        datafile, contents = self.create_datafile_in_cloud()
-        new_datafile = Datafile(datafile.path)
+        datafile = Datafile(self.READ_ONLY_CLOUD_PATH)
 
-        with open(new_datafile.local_path) as f:
-            self.assertEqual(f.read(), contents)
+        with open(datafile.local_path) as f:
+            self.assertEqual(f.read(), self.READ_ONLY_CLOUD_FILE_CONTENTS)
 
     def test_local_path_with_cached_file_avoids_downloading_again(self):
         """Test that attempting to download a cached file doesn't result in a new download."""
-        datafile, _ = self.create_datafile_in_cloud()
-        new_datafile = Datafile(datafile.cloud_path)
+        new_datafile = Datafile(self.READ_ONLY_CLOUD_PATH)
 
         # Download for first time.
         new_datafile.download()
@@ -390,11 +476,10 @@ class TestDatafile(BaseTestCase):
 
     def test_open_with_reading_cloud_file(self):
         """Test that a cloud datafile can be opened for reading."""
-        datafile, contents = self.create_datafile_in_cloud()
-        new_datafile = Datafile(datafile.cloud_path)
+        datafile = Datafile(self.READ_ONLY_CLOUD_PATH)
 
-        with new_datafile.open() as f:
-            self.assertEqual(f.read(), contents)
+        with datafile.open() as f:
+            self.assertEqual(f.read(), self.READ_ONLY_CLOUD_FILE_CONTENTS)
 
     def test_open_with_writing_to_cloud_file(self):
         """Test that a cloud datafile can be opened for writing and that both the remote and local copies are updated."""
@@ -407,10 +492,10 @@ class TestDatafile(BaseTestCase):
             f.write(new_file_contents)
 
             # Check that the cloud file isn't updated until the context manager is closed.
-            self.assertEqual(GoogleCloudStorageClient().download_as_string(datafile.cloud_path), original_contents)
+            self.assertEqual(get_storage_client().download_as_string(datafile.cloud_path), original_contents)
 
         # Check that the cloud file has now been updated.
-        self.assertEqual(GoogleCloudStorageClient().download_as_string(datafile.cloud_path), new_file_contents)
+        self.assertEqual(get_storage_client().download_as_string(datafile.cloud_path), new_file_contents)
 
         # Check that the local copy has been updated.
         with new_datafile.open() as f:
@@ -532,7 +617,7 @@ class TestDatafile(BaseTestCase):
         with Datafile(path=path, mode="w") as (datafile, f):
             f.write('{"my": "data"}')
 
-        data = GoogleCloudStorageClient().download_as_string(path)
+        data = get_storage_client().download_as_string(path)
         self.assertEqual(data, '{"my": "data"}')
 
     def test_reset_local_path_of_local_datafile_results_in_error(self):
@@ -599,7 +684,7 @@ class TestDatafile(BaseTestCase):
             with open("blib.txt") as f:
                 self.assertEqual(f.read(), expected_contents)
 
-            self.assertEqual(GoogleCloudStorageClient().download_as_string(datafile.cloud_path), expected_contents)
+            self.assertEqual(get_storage_client().download_as_string(datafile.cloud_path), expected_contents)
 
         finally:
             os.remove("blib.txt")
@@ -623,7 +708,7 @@ class TestDatafile(BaseTestCase):
         datafile.cloud_path = f"gs://{TEST_BUCKET_NAME}/my-file.dat"
 
         # Check that the local file's contents have been written to the cloud path.
-        self.assertEqual(GoogleCloudStorageClient().download_as_string(datafile.cloud_path), "hello")
+        self.assertEqual(get_storage_client().download_as_string(datafile.cloud_path), "hello")
 
     def test_instantiating_local_file_with_cloud_path(self):
         """Test that a local datafile instantiated with a cloud path causes the local file to be uploaded to the cloud."""
@@ -636,12 +721,12 @@ class TestDatafile(BaseTestCase):
         self.assertTrue(datafile.exists_in_cloud)
 
         # Check that the local file's contents have been written to the cloud path.
-        self.assertEqual(GoogleCloudStorageClient().download_as_string(datafile.cloud_path), "blah")
+        self.assertEqual(get_storage_client().download_as_string(datafile.cloud_path), "blah")
 
     def test_instantiating_cloud_file_with_non_existent_local_path(self):
         """Test that a cloud datafile instantiated with a non-existent local path is kept in sync with the cloud object."""
         cloud_path = f"gs://{TEST_BUCKET_NAME}/cake/taste.txt"
-        GoogleCloudStorageClient().upload_from_string("yum", cloud_path=cloud_path)
+        get_storage_client().upload_from_string("yum", cloud_path=cloud_path)
 
         with tempfile.TemporaryDirectory() as temporary_directory:
 
@@ -661,7 +746,7 @@ class TestDatafile(BaseTestCase):
         that any previous contents the file at the local path has is overwritten by the contents of the cloud object.
         """
         cloud_path = f"gs://{TEST_BUCKET_NAME}/cake/taste.txt"
-        GoogleCloudStorageClient().upload_from_string("yum", cloud_path=cloud_path)
+        get_storage_client().upload_from_string("yum", cloud_path=cloud_path)
 
         with tempfile.TemporaryDirectory() as temporary_directory:
             local_path = os.path.join(temporary_directory, "my-file.txt")
@@ -743,7 +828,7 @@ class TestDatafile(BaseTestCase):
 
             download_path = os.path.join(temporary_directory, "downloaded-file.hdf5")
 
-            GoogleCloudStorageClient().download_to_file(local_path=download_path, cloud_path=datafile.cloud_path)
+            get_storage_client().download_to_file(local_path=download_path, cloud_path=datafile.cloud_path)
 
             with h5py.File(download_path) as f:
                 self.assertEqual(list(f["dataset"]), list(range(10)))
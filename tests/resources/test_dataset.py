@@ -6,18 +6,17 @@ from unittest.mock import patch
 
 from octue import REPOSITORY_ROOT, exceptions
 from octue.cloud import storage
-from octue.cloud.storage import GoogleCloudStorageClient
 from octue.resources import Datafile, Dataset
 from octue.resources.filter_containers import FilterSet
 from octue.utils.local_metadata import LOCAL_METADATA_FILENAME
 from tests import TEST_BUCKET_NAME
-from tests.base import BaseTestCase
+from tests.base import BaseTestCase, get_storage_client
 from tests.resources import create_dataset_with_two_files
 
 
 class TestDataset(BaseTestCase):
     def _create_nested_cloud_dataset(self, dataset_name="a_dataset"):
-        cloud_storage_client = GoogleCloudStorageClient()
+        cloud_storage_client = get_storage_client()
 
         cloud_storage_client.upload_from_string(
             "[1, 2, 3]", cloud_path=storage.path.generate_gs_path(TEST_BUCKET_NAME, dataset_name, "file_0.txt")
@@ -332,7 +331,7 @@ class TestDataset(BaseTestCase):
         """Test that any cloud directory can be accessed as a dataset if it has no `.octue` metadata file in it, the
         cloud dataset doesn't lose any information during serialization, and a metadata file is uploaded afterwards.
         """
-        cloud_storage_client = GoogleCloudStorageClient()
+        cloud_storage_client = get_storage_client()
 
         cloud_storage_client.upload_from_string(
             "[1, 2, 3]",
@@ -397,7 +396,7 @@ class TestDataset(BaseTestCase):
 
         # Test dataset metadata file has been uploaded.
         dataset_metadata = json.loads(
-            GoogleCloudStorageClient().download_as_string(
+            get_storage_client().download_as_string(
                 cloud_path=storage.path.join(cloud_dataset.path, LOCAL_METADATA_FILENAME)
             )
         )
@@ -468,7 +467,7 @@ class TestDataset(BaseTestCase):
             cloud_path = storage.path.generate_gs_path(TEST_BUCKET_NAME, output_directory, dataset.name)
             dataset.to_cloud(cloud_path)
 
-            storage_client = GoogleCloudStorageClient()
+            storage_client = get_storage_client()
 
             # Check its files have been uploaded.
             persisted_file_0 = storage_client.download_as_string(storage.path.join(cloud_path, "file_0.txt"))
@@ -526,7 +525,7 @@ class TestDataset(BaseTestCase):
 
     def test_download_all_files(self):
         """Test that all files in a dataset can be downloaded with one command."""
-        storage_client = GoogleCloudStorageClient()
+        storage_client = get_storage_client()
 
         dataset_name = "another-dataset"
         storage_client.upload_from_string(
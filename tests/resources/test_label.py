@@ -173,6 +173,40 @@ class TestLabelSet(BaseTestCase):
         for label in "b", "d", "e":
             self.assertFalse(self.LABEL_SET.any_label_ends_with(label))
 
+    def test_any_label_contains(self):
+        """Ensure contains checks within each label but not across the boundaries between labels."""
+        for label in "a", "b-c", "e-f":
+            self.assertTrue(self.LABEL_SET.any_label_contains(label))
+
+        for label in "ab", "cd", "g":
+            self.assertFalse(self.LABEL_SET.any_label_contains(label))
+
+    def test_searching_labels_doesnt_match_across_labels(self):
+        """Ensure values spanning two labels joined by a separator character don't match any label."""
+        for value in "a\x00b-c", "a\x00", "\x00b", "a b-c":
+            with self.subTest(value=value):
+                self.assertFalse(self.LABEL_SET.any_label_starts_with(value))
+                self.assertFalse(self.LABEL_SET.any_label_ends_with(value))
+                self.assertFalse(self.LABEL_SET.any_label_contains(value))
+
+    def test_searching_labels_with_non_string_value_raises_error(self):
+        """Ensure searching a label set's labels with a non-string value raises an error instead of matching the
+        value's string representation.
+        """
+        label_set = LabelSet("a b-c 1")
+
+        for method in label_set.any_label_starts_with, label_set.any_label_ends_with, label_set.any_label_contains:
+            with self.subTest(method=method.__name__):
+                with self.assertRaises(TypeError):
+                    method(1)
+
+    def test_empty_label_set_has_no_label_matching_empty_value(self):
+        """Ensure an empty label set doesn't match an empty value when searching its labels."""
+        label_set = LabelSet()
+        self.assertFalse(label_set.any_label_starts_with(""))
+        self.assertFalse(label_set.any_label_ends_with(""))
+        self.assertFalse(label_set.any_label_contains(""))
+
     def test_serialise(self):
         """Ensure that LabelSets serialise to a list."""
         self.assertEqual(
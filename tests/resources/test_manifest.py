@@ -5,10 +5,9 @@ import tempfile
 from unittest.mock import patch
 
 from octue.cloud import storage
-from octue.cloud.storage import GoogleCloudStorageClient
 from octue.resources import Datafile, Dataset, Manifest
 from tests import TEST_BUCKET_NAME
-from tests.base import BaseTestCase
+from tests.base import BaseTestCase, get_storage_client
 from tests.resources import create_dataset_with_two_files
 
 
@@ -89,7 +88,7 @@ class TestManifest(BaseTestCase):
             cloud_path = storage.path.generate_gs_path(TEST_BUCKET_NAME, "manifest.json")
             manifest.to_cloud(cloud_path)
 
-            persisted_manifest = json.loads(GoogleCloudStorageClient().download_as_string(cloud_path))
+            persisted_manifest = json.loads(get_storage_client().download_as_string(cloud_path))
             self.assertEqual(persisted_manifest["datasets"]["my-dataset"], "gs://octue-test-bucket/my-small-dataset")
 
     def test_from_cloud(self):
@@ -123,12 +122,12 @@ class TestManifest(BaseTestCase):
         """Test that a Manifest can be instantiated from a serialized cloud dataset with no `dataset.json` file. This
         simulates what happens when such a cloud dataset is referred to in a manifest received by a child service.
         """
-        GoogleCloudStorageClient().upload_from_string(
+        get_storage_client().upload_from_string(
             "[1, 2, 3]",
             cloud_path=storage.path.generate_gs_path(TEST_BUCKET_NAME, "my_dataset", "file_0.txt"),
         )
 
-        GoogleCloudStorageClient().upload_from_string(
+        get_storage_client().upload_from_string(
             "[4, 5, 6]",
             cloud_path=storage.path.generate_gs_path(TEST_BUCKET_NAME, "my_dataset", "file_1.txt"),
         )
@@ -142,7 +141,7 @@ class TestManifest(BaseTestCase):
 
     def test_instantiating_from_datasets_from_different_cloud_buckets(self):
         """Test instantiating a manifest from multiple datasets from different cloud buckets."""
-        storage_client = GoogleCloudStorageClient()
+        storage_client = get_storage_client()
         storage_client.create_bucket(name="another-test-bucket")
 
         storage_client.upload_from_string(
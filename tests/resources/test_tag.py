@@ -20,6 +20,23 @@ class TestTagDict(TestCase):
         with self.assertRaises(exceptions.InvalidTagException):
             TagDict({".blah.": "blue"})
 
+    def test_valid_tag_names(self):
+        """Test that tag names made of lowercase letters, digits and underscores that don't start or end with an
+        underscore pass validation.
+        """
+        for name in "a", "1", "abc", "a1", "1a", "a_b", "hello_world_2", "a__b":
+            with self.subTest(name=name):
+                self.assertEqual(TagDict({name: 1}), {name: 1})
+
+    def test_invalid_tag_names(self):
+        """Test that tag names that are empty, aren't strings or contain characters other than lowercase letters,
+        digits and underscores, or that start or end with an underscore, fail validation.
+        """
+        for name in "", "_", "_a", "a_", "A", "aB", "a-b", "a b", "a.b", "é", "a\n", " a", 1, None, ("a",):
+            with self.subTest(name=name):
+                with self.assertRaises(exceptions.InvalidTagException):
+                    TagDict({name: 1})
+
     def test_update_fails_if_tag_name_fails_validation(self):
         """Test that updating fails if any keys don't conform to the tag name pattern."""
         tag_dict = TagDict({"a": 1, "b": 2})
@@ -29,6 +46,15 @@ class TestTagDict(TestCase):
 
         self.assertEqual(tag_dict, {"a": 1, "b": 2})
 
+    def test_update_fails_if_keyword_argument_tag_name_fails_validation(self):
+        """Test that updating fails if any tags given as keyword arguments don't conform to the tag name pattern."""
+        tag_dict = TagDict({"a": 1, "b": 2})
+
+        with self.assertRaises(exceptions.InvalidTagException):
+            tag_dict.update({"c": 3}, _d_=4)
+
+        self.assertEqual(tag_dict, {"a": 1, "b": 2})
+
     def test_update(self):
         """Test that TagDicts can be updated with tags with valid names."""
         tag_dict = TagDict({"a": 1, "b": 2})
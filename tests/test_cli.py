@@ -19,73 +19,82 @@ from tests.test_app_modules.app_module.app import CUSTOM_APP_RUN_MESSAGE
 
 TWINE_FILE_PATH = os.path.join(TESTS_DIR, "data", "twines", "valid_schema_twine.json")
 
+# The runner keeps no state between invocations, so one is shared by all the tests.
+CLI_RUNNER = CliRunner()
+
 
 class TestCLI(BaseTestCase):
     def test_version(self):
         """Ensure the version command works in the CLI."""
-        result = CliRunner().invoke(octue_cli, ["--version"])
+        result = CLI_RUNNER.invoke(octue_cli, ["--version"])
         assert "version" in result.output
 
     def test_help(self):
         """Ensure the help commands works in the CLI."""
-        help_result = CliRunner().invoke(octue_cli, ["--help"])
+        help_result = CLI_RUNNER.invoke(octue_cli, ["--help"])
         assert help_result.output.startswith("Usage")
 
-        h_result = CliRunner().invoke(octue_cli, ["-h"])
+        h_result = CLI_RUNNER.invoke(octue_cli, ["-h"])
         assert help_result.output == h_result.output
 
 
 class TestRunCommand(BaseTestCase):
+    def setUp(self):
+        """Create a temporary output directory for the test, removing it once the test has finished.
+
+        :return None:
+        """
+        super().setUp()
+        self.output_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.output_directory.cleanup)
+
     def test_run(self):
         """Test that an arbitrary run command can be used in the run command of the CLI."""
-        with tempfile.TemporaryDirectory() as temporary_directory:
-            result = CliRunner().invoke(
-                octue_cli,
-                [
-                    "run",
-                    f"--app-dir={os.path.join(TESTS_DIR, 'test_app_modules', 'app_module')}",
-                    f"--twine={TWINE_FILE_PATH}",
-                    f'--config-dir={os.path.join(TESTS_DIR, "data", "data_dir_with_no_manifests", "configuration")}',
-                    f'--input-dir={os.path.join(TESTS_DIR, "data", "data_dir_with_no_manifests", "input")}',
-                    f"--output-dir={temporary_directory}",
-                ],
-            )
+        result = CLI_RUNNER.invoke(
+            octue_cli,
+            [
+                "run",
+                f"--app-dir={os.path.join(TESTS_DIR, 'test_app_modules', 'app_module')}",
+                f"--twine={TWINE_FILE_PATH}",
+                f'--config-dir={os.path.join(TESTS_DIR, "data", "data_dir_with_no_manifests", "configuration")}',
+                f'--input-dir={os.path.join(TESTS_DIR, "data", "data_dir_with_no_manifests", "input")}',
+                f"--output-dir={self.output_directory.name}",
+            ],
+        )
 
         assert CUSTOM_APP_RUN_MESSAGE in result.output
 
     def test_run_with_data_dir(self):
         """Test that the run command of the CLI works with the --data-dir option."""
-        with tempfile.TemporaryDirectory() as temporary_directory:
-            result = CliRunner().invoke(
+        result = CLI_RUNNER.invoke(
+            octue_cli,
+            [
+                "run",
+                f"--app-dir={os.path.join(TESTS_DIR, 'test_app_modules', 'app_module')}",
+                f"--twine={TWINE_FILE_PATH}",
+                f'--data-dir={os.path.join(TESTS_DIR, "data", "data_dir_with_no_manifests")}',
+                f"--output-dir={self.output_directory.name}",
+            ],
+        )
+
+        assert CUSTOM_APP_RUN_MESSAGE in result.output
+
+    def test_remote_logger_uri_can_be_set(self):
+        """Test that remote logger URI can be set via the CLI and that this is logged locally."""
+        with mock.patch("logging.StreamHandler.emit") as mock_local_logger_emit:
+            CLI_RUNNER.invoke(
                 octue_cli,
                 [
+                    "--logger-uri=wss://0.0.0.1:3000",
                     "run",
-                    f"--app-dir={os.path.join(TESTS_DIR, 'test_app_modules', 'app_module')}",
+                    f"--app-dir={TESTS_DIR}",
                     f"--twine={TWINE_FILE_PATH}",
                     f'--data-dir={os.path.join(TESTS_DIR, "data", "data_dir_with_no_manifests")}',
-                    f"--output-dir={temporary_directory}",
+                    f"--output-dir={self.output_directory.name}",
                 ],
             )
 
-        assert CUSTOM_APP_RUN_MESSAGE in result.output
-
-    def test_remote_logger_uri_can_be_set(self):
-        """Test that remote logger URI can be set via the CLI and that this is logged locally."""
-        with tempfile.TemporaryDirectory() as temporary_directory:
-            with mock.patch("logging.StreamHandler.emit") as mock_local_logger_emit:
-                CliRunner().invoke(
-                    octue_cli,
-                    [
-                        "--logger-uri=wss://0.0.0.1:3000",
-                        "run",
-                        f"--app-dir={TESTS_DIR}",
-                        f"--twine={TWINE_FILE_PATH}",
-                        f'--data-dir={os.path.join(TESTS_DIR, "data", "data_dir_with_no_manifests")}',
-                        f"--output-dir={temporary_directory}",
-                    ],
-                )
-
-            mock_local_logger_emit.assert_called()
+        mock_local_logger_emit.assert_called()
 
 
 class TestStartCommand(BaseTestCase):
@@ -137,7 +146,7 @@ class TestStartCommand(BaseTestCase):
                     with mock.patch("google.cloud.pubsub_v1.SubscriberClient", MockSubscriber):
                         with mock.patch("octue.cli.Service", MockService):
 
-                            result = CliRunner().invoke(
+                            result = CLI_RUNNER.invoke(
                                 octue_cli,
                                 [
                                     "start",
@@ -153,7 +162,7 @@ class TestStartCommand(BaseTestCase):
 class TestDeployCommand(BaseTestCase):
     def test_deploy_command_group(self):
         """Test that the `dataflow` command is a subcommand of the `deploy` command."""
-        result = CliRunner().invoke(octue_cli, ["deploy", "--help"])
+        result = CLI_RUNNER.invoke(octue_cli, ["deploy", "--help"])
         self.assertIn("cloud-run ", result.output)
         self.assertIn("dataflow ", result.output)
 
@@ -162,7 +171,7 @@ class TestDeployCommand(BaseTestCase):
         the service ID.
         """
         with tempfile.NamedTemporaryFile(delete=False) as temporary_file:
-            result = CliRunner().invoke(
+            result = CLI_RUNNER.invoke(
                 octue_cli,
                 ["deploy", "cloud-run", f"--octue-configuration-path={temporary_file.name}", "--update"],
             )
@@ -175,7 +184,7 @@ class TestDeployCommand(BaseTestCase):
         """
         with mock.patch("octue.cli.APACHE_BEAM_PACKAGE_AVAILABLE", False):
             with tempfile.NamedTemporaryFile(delete=False) as temporary_file:
-                result = CliRunner().invoke(
+                result = CLI_RUNNER.invoke(
                     octue_cli,
                     [
                         "deploy",
@@ -192,7 +201,7 @@ class TestDeployCommand(BaseTestCase):
         the service ID.
         """
         with tempfile.NamedTemporaryFile(delete=False) as temporary_file:
-            result = CliRunner().invoke(
+            result = CLI_RUNNER.invoke(
                 octue_cli,
                 ["deploy", "dataflow", f"--octue-configuration-path={temporary_file.name}", "--update"],
             )
@@ -0,0 +1,33 @@
+import datetime
+import json
+from types import SimpleNamespace
+from unittest import TestCase
+
+from octue.utils.encoders import OctueJSONEncoder
+
+
+class TestOctueJSONEncoder(TestCase):
+    def test_to_primitive_set_on_instance_is_used(self):
+        """Test that a `to_primitive` method set on an instance rather than its class is used to encode it."""
+        instance = SimpleNamespace(to_primitive=lambda: {"hello": "world"})
+        self.assertEqual(json.dumps(instance, cls=OctueJSONEncoder), json.dumps({"hello": "world"}))
+
+    def test_to_primitive_provided_by_getattr_is_used(self):
+        """Test that a `to_primitive` method provided dynamically by `__getattr__` is used to encode the object."""
+
+        class DynamicToPrimitive:
+            def __getattr__(self, name):
+                if name == "to_primitive":
+                    return lambda: "dynamic"
+                raise AttributeError(name)
+
+        self.assertEqual(json.dumps(DynamicToPrimitive(), cls=OctueJSONEncoder), json.dumps("dynamic"))
+
+    def test_datetimes_are_encoded(self):
+        """Test that datetimes are encoded with their type and ISO format."""
+        value = datetime.datetime(2021, 1, 2, 3, 4, 5)
+
+        self.assertEqual(
+            json.dumps(value, cls=OctueJSONEncoder),
+            json.dumps({"_type": "datetime", "value": "2021-01-02T03:04:05"}),
+        )